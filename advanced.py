@@ -1,22 +1,25 @@
 import time
+import json
+import threading
 from types import MethodType
+from collections import deque
 
 from qt.core import (
     Qt, QObject, QDialog, QGroupBox, QWidget, QVBoxLayout, QHBoxLayout,
     QPlainTextEdit, QPushButton, QSplitter, QLabel, QThread, QLineEdit,
     QGridLayout, QProgressBar, pyqtSignal, pyqtSlot, QPixmap, QEvent,
     QStackedWidget, QSpacerItem, QTabWidget, QCheckBox,
-    QComboBox, QSizePolicy)
+    QComboBox, QSizePolicy, QTimer, QImage, QRunnable, QThreadPool)
 from calibre.constants import __version__
 
 from . import EbookTranslator
-from .lib.utils import uid, traceback_error
+from .lib.utils import traceback_error
 from .lib.config import get_config
 from .lib.encodings import encoding_list
-from .lib.cache import Paragraph, get_cache
+from .lib.cache import Paragraph, get_cache, get_cache_id
 from .lib.translation import get_engine_class, get_translator, get_translation
 from .lib.element import get_element_handler
-from .lib.conversion import extract_item, extra_formats
+from .lib.conversion import stream_item, extra_formats
 from .engines.openai import ChatgptTranslate, ChatgptBatchTranslate
 from .engines.custom import CustomTranslate
 from .components import (
@@ -50,6 +53,31 @@ class EditorWorker(QObject):
         self.finished.emit()
 
 
+class CoverLoader(QRunnable):
+    """Load and scale the cover in the thread pool. QImage is used because,
+    unlike QPixmap, it can be safely handled outside of the GUI thread.
+    """
+    class Signals(QObject):
+        loaded = pyqtSignal(QImage)
+
+    def __init__(self, api, book_id, height):
+        QRunnable.__init__(self)
+        self.api = api
+        self.book_id = book_id
+        self.height = height
+        self.signals = self.Signals()
+
+    def run(self):
+        try:
+            image = self.api.cover(self.book_id, as_image=True)
+        except Exception:
+            image = None
+        if image is None or image.isNull():
+            image = QImage(I('default_cover.png'))
+        self.signals.loaded.emit(image.scaledToHeight(
+            self.height, Qt.TransformationMode.SmoothTransformation))
+
+
 class PreparationWorker(QObject):
     start = pyqtSignal()
     progress = pyqtSignal(int)
@@ -79,6 +107,16 @@ class PreparationWorker(QObject):
     # def cancel(self):
     #     return self.thread().isInterruptionRequested()
 
+    def track_progress(self, elements, start, end, step=64):
+        """Approach the end of the progress as elements are consumed."""
+        for index, element in enumerate(elements, 1):
+            if self.canceled:
+                return
+            if index % step == 0:
+                progress = (end - start) * step // (index + step)
+                self.progress.emit(end - progress)
+            yield element
+
     @pyqtSlot()
     def prepare_ebook_data(self):
         self.on_working = True
@@ -90,9 +128,9 @@ class PreparationWorker(QObject):
         encoding = ''
         if self.ebook.encoding.lower() != 'utf-8':
             encoding = self.ebook.encoding.lower()
-        cache_id = uid(
-            input_path + self.engine_class.name + self.ebook.target_lang
-            + merge_length + encoding)
+        cache_id = get_cache_id(
+            input_path, self.engine_class.name, self.ebook.target_lang,
+            merge_length, encoding)
         cache = get_cache(cache_id)
 
         if cache.is_fresh() or not cache.is_persistence():
@@ -104,14 +142,15 @@ class PreparationWorker(QObject):
             cache.set_info('merge_length', merge_length)
             cache.set_info('plugin_version', EbookTranslator.__version__)
             cache.set_info('calibre_version', __version__)
-            # --------------------------
-            a = time.time()
-            # --------------------------
             self.progress_message.emit(_('Extracting ebook content...'))
+            self.progress.emit(10)
+            # Filter the elements while the rest of the ebook is extracted.
             try:
-                elements = extract_item(
+                elements = stream_item(
                     input_path, self.ebook.input_format, self.ebook.encoding,
                     self.progress_detail.emit)
+                original_group = element_handler.prepare_original(
+                    self.track_progress(elements, 10, 80))
             except Exception:
                 self.progress_message.emit(
                     _('Failed to extract ebook content'))
@@ -119,30 +158,13 @@ class PreparationWorker(QObject):
                 self.progress.emit(100)
                 self.clean_cache(cache)
                 return
-            if self.canceled:
-                self.clean_cache(cache)
-                return
-            self.progress.emit(30)
-            b = time.time()
-            self.progress_detail.emit('extracting timing: %s' % (b - a))
-            if self.canceled:
-                self.clean_cache(cache)
-                return
-            # --------------------------
-            self.progress_message.emit(_('Filtering ebook content...'))
-            original_group = element_handler.prepare_original(elements)
             self.progress.emit(80)
-            c = time.time()
-            self.progress_detail.emit('filtering timing: %s' % (c - b))
             if self.canceled:
                 self.clean_cache(cache)
                 return
-            # --------------------------
             self.progress_message.emit(_('Preparing user interface...'))
             cache.save(original_group)
             self.progress.emit(100)
-            d = time.time()
-            self.progress_detail.emit('cache timing: %s' % (d - c))
             if self.canceled:
                 self.clean_cache(cache)
                 return
@@ -163,28 +185,73 @@ class TranslationWorker(QObject):
     logging = pyqtSignal(str, bool)
     # error = pyqtSignal(str, str, str)
     streaming = pyqtSignal(object)
-    callback = pyqtSignal(object)
+    paragraphs_done = pyqtSignal(list)
+    warm_up = pyqtSignal()
+
+    # Seconds to collect the translated paragraphs before emitting them.
+    done_window = 0.05
 
     def __init__(self, engine_class, ebook):
         QObject.__init__(self)
         self.source_lang = ebook.source_lang
         self.target_lang = ebook.target_lang
         self.engine_class = engine_class
+        self.translator = None
+        self.translator_key = None
+
+        self.done_paragraphs = []
+        self.done_emitted_at = 0.0
+        self.done_timer = None
+        self.done_lock = threading.RLock()
 
         self.on_working = False
         self.canceled = False
         self.need_close = False
         self.translate.connect(self.translate_paragraphs)
+        self.warm_up.connect(self.warm_up_engine)
         # self.finished.connect(lambda: self.set_canceled(False))
 
     def set_source_lang(self, lang):
         self.source_lang = lang
+        self.translator = None
 
     def set_target_lang(self, lang):
         self.target_lang = lang
+        self.translator = None
 
     def set_engine_class(self, engine_class):
         self.engine_class = engine_class
+        self.translator = None
+        # Fetch the access token in the worker thread ahead of translation.
+        self.warm_up.emit()
+
+    def get_translator_key(self):
+        """Summarize the settings that the translator is created from."""
+        config = get_config()
+        return json.dumps([
+            self.engine_class.name, self.engine_class.config,
+            getattr(self.engine_class, 'request', None),
+            getattr(self.engine_class, 'response', None),
+            config.get('search_paths'), config.get('proxy_enabled'),
+            config.get('proxy_setting'), config.get('merge_enabled')],
+            sort_keys=True, default=str)
+
+    def load_translator(self):
+        """Reuse the translator until the engine, languages or settings
+        change, so its API keys and tokens are kept between translations.
+        """
+        translator_key = self.get_translator_key()
+        if self.translator is None or self.translator_key != translator_key:
+            translator = get_translator(self.engine_class)
+            translator.set_source_lang(self.source_lang)
+            translator.set_target_lang(self.target_lang)
+            self.translator = translator
+            self.translator_key = translator_key
+        return self.translator
+
+    @pyqtSlot()
+    def warm_up_engine(self):
+        self.load_translator().warm_up()
 
     def set_canceled(self, canceled):
         self.canceled = canceled
@@ -195,22 +262,45 @@ class TranslationWorker(QObject):
     def set_need_close(self, need_close):
         self.need_close = need_close
 
+    def collect_paragraph(self, paragraph):
+        """Emit the translated paragraphs in groups at most once per window,
+        instead of queuing a signal to the GUI thread for each of them.
+        """
+        with self.done_lock:
+            self.done_paragraphs.append(paragraph)
+            if self.done_timer is not None:
+                return
+            delay = self.done_emitted_at + self.done_window - time.monotonic()
+            if delay > 0:
+                self.done_timer = threading.Timer(delay, self.emit_paragraphs)
+                self.done_timer.start()
+            else:
+                self.emit_paragraphs()
+
+    def emit_paragraphs(self):
+        with self.done_lock:
+            if self.done_timer is not None:
+                self.done_timer.cancel()
+                self.done_timer = None
+            if len(self.done_paragraphs) > 0:
+                self.paragraphs_done.emit(self.done_paragraphs)
+                self.done_paragraphs = []
+                self.done_emitted_at = time.monotonic()
+
     @pyqtSlot(list, bool)
     def translate_paragraphs(self, paragraphs=[], fresh=False):
         """:fresh: retranslate all paragraphs."""
         self.on_working = True
         self.start.emit()
-        translator = get_translator(self.engine_class)
-        translator.set_source_lang(self.source_lang)
-        translator.set_target_lang(self.target_lang)
-        translation = get_translation(translator)
+        translation = get_translation(self.load_translator())
         translation.set_fresh(fresh)
         translation.set_logging(
             lambda text, error=False: self.logging.emit(text, error))
         translation.set_streaming(self.streaming.emit)
-        translation.set_callback(self.callback.emit)
+        translation.set_callback(self.collect_paragraph)
         translation.set_cancel_request(self.cancel_request)
         translation.handle(paragraphs)
+        self.emit_paragraphs()
         self.on_working = False
         self.finished.emit()
         if self.need_close:
@@ -353,7 +443,7 @@ class CreateTranslationProject(QDialog):
 class AdvancedTranslation(QDialog):
     paragraph_sig = pyqtSignal(object)
     ebook_title = pyqtSignal()
-    progress_bar = pyqtSignal()
+    progress_bar = pyqtSignal(int)
     batch_translation = pyqtSignal()
 
     preparation_thread = QThread()
@@ -374,9 +464,24 @@ class AdvancedTranslation(QDialog):
         self.cache = None
         self.merge_enabled = False
 
-        self.progress_step = 0
+        self.progress_total = 0
+        self.progress_count = 0
         self.translate_all = False
 
+        # The log tabs are built on first show, keep the logs until then.
+        self.logging_text = None
+        self.errors_text = None
+        self.logging_buffer: deque = deque(maxlen=10000)
+        self.errors_buffer: deque = deque(maxlen=10000)
+        self.has_errors = False
+
+        # Translated paragraphs are written to the cache in groups.
+        self.pending_paragraphs = []
+        self.pending_timer = QTimer(self)
+        self.pending_timer.setSingleShot(True)
+        self.pending_timer.setInterval(500)
+        self.pending_timer.timeout.connect(self.flush_pending_paragraphs)
+
         self.editor_worker = EditorWorker()
         self.editor_worker.moveToThread(self.editor_thread)
         self.editor_thread.finished.connect(self.editor_worker.deleteLater)
@@ -406,13 +511,14 @@ class AdvancedTranslation(QDialog):
         layout.addWidget(self.footer)
 
         def working_status():
-            self.logging_text.clear()
-            self.errors_text.clear()
+            self.logging_buffer.clear()
+            self.errors_buffer.clear()
+            self.logging_text is not None and self.logging_text.clear()
+            self.errors_text is not None and self.errors_text.clear()
+            self.has_errors = False
         self.trans_worker.start.connect(working_status)
 
-        self.trans_worker.logging.connect(
-            lambda text, error: self.errors_text.appendPlainText(text)
-            if error else self.logging_text.appendPlainText(text))
+        self.trans_worker.logging.connect(self.append_log)
 
         def working_finished():
             if self.translate_all and not self.trans_worker.cancel_request():
@@ -456,25 +562,26 @@ class AdvancedTranslation(QDialog):
         widget = QWidget()
         layout = QGridLayout(widget)
 
-        try:
-            cover_image = self.api.cover(self.ebook.id, as_pixmap=True)
-        except Exception:
-            cover_image = QPixmap(self.api.cover(self.ebook.id, as_image=True))
-        if cover_image.isNull():
-            cover_image = QPixmap(I('default_cover.png'))
-        cover_image = cover_image.scaledToHeight(
-            480, Qt.TransformationMode.SmoothTransformation)
-
         cover = QLabel()
         cover.setAlignment(Qt.AlignCenter)
-        cover.setPixmap(cover_image)
-
         title = QLabel()
-        title.setMaximumWidth(cover_image.width())
-        title.setText(title.fontMetrics().elidedText(
-            self.ebook.title, Qt.ElideRight, title.width()))
         title.setToolTip(self.ebook.title)
 
+        def show_cover(cover_image):
+            cover.setPixmap(cover_image)
+            title.setMaximumWidth(cover_image.width())
+            title.setText(title.fontMetrics().elidedText(
+                self.ebook.title, Qt.ElideRight, title.maximumWidth()))
+
+        # Show the default cover until the real one is scaled in background.
+        show_cover(QPixmap(I('default_cover.png')).scaledToHeight(
+            480, Qt.TransformationMode.SmoothTransformation))
+        self.cover_loader = CoverLoader(self.api, self.ebook.id, 480)
+        self.cover_loader.setAutoDelete(False)
+        self.cover_loader.signals.loaded.connect(
+            lambda image: show_cover(QPixmap.fromImage(image)))
+        QThreadPool.globalInstance().start(self.cover_loader)
+
         progress_bar = QProgressBar()
         progress_bar.setFormat('')
         progress_bar.setValue(0)
@@ -518,16 +625,27 @@ class AdvancedTranslation(QDialog):
 
         tabs = QTabWidget()
         review_index = tabs.addTab(self.layout_review(), _('Review'))
-        log_index = tabs.addTab(self.layout_log(), _('Log'))
-        errors_index = tabs.addTab(self.layout_errors(), _('Errors'))
+        log_tab = QWidget()
+        QVBoxLayout(log_tab).setContentsMargins(0, 0, 0, 0)
+        log_index = tabs.addTab(log_tab, _('Log'))
+        errors_tab = QWidget()
+        QVBoxLayout(errors_tab).setContentsMargins(0, 0, 0, 0)
+        errors_index = tabs.addTab(errors_tab, _('Errors'))
         tabs.setStyleSheet('QTabBar::tab {min-width:120px;}')
 
+        def build_tab(index):
+            if index == log_index and self.logging_text is None:
+                log_tab.layout().addWidget(self.layout_log())
+            elif index == errors_index and self.errors_text is None:
+                errors_tab.layout().addWidget(self.layout_errors())
+        tabs.currentChanged.connect(build_tab)
+
         self.trans_worker.start.connect(
             lambda: (self.translate_all or self.table.selected_count() > 1)
             and tabs.setCurrentIndex(log_index))
         self.trans_worker.finished.connect(
             lambda: tabs.setCurrentIndex(
-                errors_index if self.errors_text.toPlainText()
+                errors_index if self.has_errors
                 and len(self.table.get_selected_paragraphs(True, True)) > 0
                 else review_index))
         splitter = QSplitter()
@@ -625,15 +743,19 @@ class AdvancedTranslation(QDialog):
         layout = QVBoxLayout(widget)
         layout.setContentsMargins(0, 0, 0, 0)
 
+        progress_maximum = 10000
         progress_bar = QProgressBar()
-        progress_bar.setMaximum(100000000)
+        progress_bar.setMaximum(progress_maximum)
         progress_bar.setVisible(False)
 
-        def write_progress():
-            value = progress_bar.value() + self.progress_step
-            if value > progress_bar.maximum():
-                value = progress_bar.maximum()
-            progress_bar.setValue(value)
+        def write_progress(count):
+            self.progress_count += count
+            value = min(
+                self.progress_count * progress_maximum
+                // (self.progress_total or 1), progress_maximum)
+            # Skip the repaint if the displayed value does not change.
+            if value != progress_bar.value():
+                progress_bar.setValue(value)
         self.progress_bar.connect(write_progress)
 
         paragraph_count = QLabel()
@@ -687,6 +809,7 @@ class AdvancedTranslation(QDialog):
         layout.addWidget(self.layout_table_control())
 
         def working_start():
+            self.progress_count = 0
             if self.translate_all or self.table.selected_count() > 1:
                 filter_widget.setVisible(False)
                 progress_bar.setValue(0)
@@ -754,7 +877,13 @@ class AdvancedTranslation(QDialog):
             delete_button.setDisabled(disabled)
             translate_selected.setDisabled(disabled)
         item_selection_changed()
-        self.table.itemSelectionChanged.connect(item_selection_changed)
+
+        # Update the buttons once per burst of selection changes.
+        selection_timer = QTimer(action_widget)
+        selection_timer.setSingleShot(True)
+        selection_timer.setInterval(0)
+        selection_timer.timeout.connect(item_selection_changed)
+        self.table.itemSelectionChanged.connect(selection_timer.start)
 
         def stop_translation():
             action = self.alert.ask(
@@ -905,7 +1034,7 @@ class AdvancedTranslation(QDialog):
             output_format.currentTextChanged.connect(change_output_format)
 
         def output_ebook():
-            if len(self.table.findItems(_('Translated'), Qt.MatchExactly)) < 1:
+            if self.table.translated_count < 1:
                 self.alert.pop(_('The ebook has not been translated yet.'))
                 return
             if self.table.non_aligned_count > 0:
@@ -968,12 +1097,22 @@ class AdvancedTranslation(QDialog):
         translation_text.cursorPositionChanged.connect(
             translation_text.ensureCursorVisible)
 
+        shown_paragraph = None
+
+        def set_plain_text(editor, text):
+            # Replacing the document resets the undo history, the cursor and
+            # the scroll position, so leave it alone if nothing changed.
+            if editor.toPlainText() != text:
+                editor.setPlainText(text)
+
         def refresh_translation(paragraph):
+            nonlocal shown_paragraph
             # TODO: check - why/how can "paragraph" be None and what should we do in such case?
             if paragraph is not None:
-                raw_text.setPlainText(paragraph.raw.strip())
-                original_text.setPlainText(paragraph.original.strip())
-                translation_text.setPlainText(paragraph.translation)
+                shown_paragraph = paragraph
+                set_plain_text(raw_text, paragraph.raw.strip())
+                set_plain_text(original_text, paragraph.original.strip())
+                set_plain_text(translation_text, paragraph.translation or '')
 
         self.paragraph_sig.connect(refresh_translation)
 
@@ -1090,29 +1229,82 @@ class AdvancedTranslation(QDialog):
             if self.trans_worker.on_working:
                 return
             paragraph = self.table.current_paragraph()
-            if paragraph is None:
+            if paragraph is None or paragraph is shown_paragraph:
                 return
             self.paragraph_sig.emit(paragraph)
             self.table.row.emit(paragraph.row)
         self.table.setCurrentItem(self.table.item(0, 0))
         change_selected_item()
-        self.table.itemSelectionChanged.connect(change_selected_item)
 
-        def translation_callback(paragraph):
-            self.table.row.emit(paragraph.row)
-            self.paragraph_sig.emit(paragraph)
-            self.cache.update_paragraph(paragraph)
-            self.progress_bar.emit()
-
-        self.trans_worker.callback.connect(translation_callback)
+        # Dragging across rows or holding the arrow keys changes the selection
+        # many times per second, so only show the row where it settles.
+        selection_timer = QTimer(widget)
+        selection_timer.setSingleShot(True)
+        selection_timer.setInterval(40)
+        selection_timer.timeout.connect(change_selected_item)
+        self.table.itemSelectionChanged.connect(selection_timer.start)
+
+        def translation_callback(paragraphs):
+            # Update the rows directly and notify the row listeners once.
+            self.table.setUpdatesEnabled(False)
+            blocked = self.table.blockSignals(True)
+            for paragraph in paragraphs[:-1]:
+                self.table.track_row_data(paragraph.row)
+            self.table.blockSignals(blocked)
+            self.table.setUpdatesEnabled(True)
+            self.table.row.emit(paragraphs[-1].row)
+            self.paragraph_sig.emit(paragraphs[-1])
+            self.pending_paragraphs.extend(paragraphs)
+            if len(self.pending_paragraphs) >= 32:
+                self.flush_pending_paragraphs()
+            elif not self.pending_timer.isActive():
+                self.pending_timer.start()
+            self.progress_bar.emit(len(paragraphs))
+
+        self.trans_worker.paragraphs_done.connect(translation_callback)
+        self.trans_worker.finished.connect(self.flush_pending_paragraphs)
+
+        # Streamed chunks are inserted at most 30 times per second, since
+        # every insertion relayouts the editor.
+        stream_buffer = []
+
+        def flush_streaming_text():
+            if len(stream_buffer) > 0:
+                translation_text.insertPlainText(''.join(stream_buffer))
+                stream_buffer.clear()
+
+        stream_timer = QTimer(widget)
+        stream_timer.setInterval(33)
+        stream_timer.timeout.connect(flush_streaming_text)
+        self.trans_worker.start.connect(stream_timer.start)
+        self.trans_worker.finished.connect(stream_timer.stop)
+        self.trans_worker.finished.connect(flush_streaming_text)
+
+        streamed_row = -1
+
+        def reset_streamed_row():
+            nonlocal streamed_row
+            streamed_row = -1
+        self.trans_worker.start.connect(reset_streamed_row)
+        # The selection signals were blocked while streaming, so let the
+        # listeners catch up with the current selection once.
+        self.trans_worker.finished.connect(self.table.itemSelectionChanged)
 
         def streaming_translation(data):
+            nonlocal streamed_row
             if data == '':
+                stream_buffer.clear()
                 translation_text.clear()
             elif isinstance(data, Paragraph):
+                flush_streaming_text()
+                if data.row == streamed_row:
+                    return
+                streamed_row = data.row
+                blocked = self.table.blockSignals(True)
                 self.table.setCurrentItem(self.table.item(data.row, 0))
+                self.table.blockSignals(blocked)
             else:
-                translation_text.insertPlainText(data)
+                stream_buffer.append(data)
         self.trans_worker.streaming.connect(streaming_translation)
 
         def modify_translation():
@@ -1129,7 +1321,11 @@ class AdvancedTranslation(QDialog):
                 save_button.setDisabled(
                     translation == (paragraph.translation or ''))
 
-        translation_text.textChanged.connect(modify_translation)
+        modification_timer = QTimer(widget)
+        modification_timer.setSingleShot(True)
+        modification_timer.setInterval(100)
+        modification_timer.timeout.connect(modify_translation)
+        translation_text.textChanged.connect(modification_timer.start)
 
         self.editor_worker.show.connect(save_status.setText)
 
@@ -1164,6 +1360,9 @@ class AdvancedTranslation(QDialog):
         self.logging_text.setPlaceholderText(_('Translation log'))
         self.logging_text.setReadOnly(True)
         layout.addWidget(self.logging_text)
+        if len(self.logging_buffer) > 0:
+            self.logging_text.appendPlainText('\n'.join(self.logging_buffer))
+            self.logging_buffer.clear()
 
         return widget
 
@@ -1175,11 +1374,23 @@ class AdvancedTranslation(QDialog):
         self.errors_text.setPlaceholderText(_('Error log'))
         self.errors_text.setReadOnly(True)
         layout.addWidget(self.errors_text)
+        if len(self.errors_buffer) > 0:
+            self.errors_text.appendPlainText('\n'.join(self.errors_buffer))
+            self.errors_buffer.clear()
 
         return widget
 
-    def get_progress_step(self, total):
-        return int(round(100.0 / (total or 1), 100) * 1000000)
+    def append_log(self, text, error=False):
+        if error:
+            self.has_errors = True
+            if self.errors_text is None:
+                self.errors_buffer.append(text)
+            else:
+                self.errors_text.appendPlainText(text)
+        elif self.logging_text is None:
+            self.logging_buffer.append(text)
+        else:
+            self.logging_text.appendPlainText(text)
 
     def translate_all_paragraphs(self):
         """Translate the untranslated paragraphs when at least one is selected.
@@ -1189,7 +1400,7 @@ class AdvancedTranslation(QDialog):
         is_fresh = len(paragraphs) < 1
         if is_fresh:
             paragraphs = self.table.get_selected_paragraphs(False, True)
-        self.progress_step = self.get_progress_step(len(paragraphs))
+        self.progress_total = len(paragraphs)
         if not self.translate_all:
             message = _(
                 'Are you sure you want to translate all {:n} paragraphs?')
@@ -1204,7 +1415,7 @@ class AdvancedTranslation(QDialog):
         if len(paragraphs) == self.table.rowCount():
             self.translate_all_paragraphs()
         else:
-            self.progress_step = self.get_progress_step(len(paragraphs))
+            self.progress_total = len(paragraphs)
             self.trans_worker.translate.emit(paragraphs, True)
 
     def install_widget_event(
@@ -1215,6 +1426,12 @@ class AdvancedTranslation(QDialog):
         source.eventFilter = MethodType(eventFilter, source)
         target.installEventFilter(source)
 
+    def flush_pending_paragraphs(self):
+        self.pending_timer.stop()
+        if self.cache is not None and len(self.pending_paragraphs) > 0:
+            self.cache.update_paragraphs(self.pending_paragraphs)
+        self.pending_paragraphs = []
+
     def terminate_preparework(self):
         if self.preparation_worker.on_working:
             if self.preparation_worker.canceled:
@@ -1251,6 +1468,7 @@ class AdvancedTranslation(QDialog):
         self.trans_thread.wait()
         self.editor_thread.quit()
         self.editor_thread.wait()
+        self.flush_pending_paragraphs()
         if self.cache is not None:
             if self.cache.is_persistence():
                 self.cache.close()
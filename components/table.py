@@ -1,7 +1,7 @@
 from qt.core import (
     Qt, QTableWidget, QHeaderView, QMenu, QAbstractItemView, QCursor,
     QBrush, QTableWidgetItem, pyqtSignal, QTableWidgetSelectionRange,
-    QColor, QPalette, QT_VERSION_STR)
+    QColor, QPalette, QTimer, QT_VERSION_STR)
 
 from ..lib.utils import group
 from ..lib.translation import get_engine_class
@@ -14,6 +14,8 @@ load_translations()
 
 class AdvancedTranslationTable(QTableWidget):
     row = pyqtSignal(int)
+    # The number of rows populated before returning to the event loop.
+    chunk_size = 500
 
     def __init__(self, parent, paragraphs):
         QTableWidget.__init__(self, parent)
@@ -21,6 +23,8 @@ class AdvancedTranslationTable(QTableWidget):
         self.paragraphs = paragraphs
 
         self.non_aligned_count = 0
+        self.translated_count = 0
+        self.populated_count = 0
         # self.setFocusPolicy(Qt.NoFocus)
         self.alert = AlertMessage(self)
         self.layout()
@@ -42,7 +46,23 @@ class AdvancedTranslationTable(QTableWidget):
         # self.verticalHeader().setStyleSheet(
         #     "QHeaderView::section{background-color:red}")
 
-        for row, paragraph in enumerate(self.paragraphs):
+        self.populate_rows()
+
+        header = self.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+
+    def is_populated(self):
+        return self.populated_count >= len(self.paragraphs)
+
+    def populate_rows(self):
+        """Create the items of the rows chunk by chunk, returning to the event
+        loop in between, so huge ebooks do not freeze the dialog.
+        """
+        start = self.populated_count
+        end = min(start + self.chunk_size, len(self.paragraphs))
+        self.setUpdatesEnabled(False)
+        for row in range(start, end):
+            paragraph = self.paragraphs[row]
             paragraph.row = row
 
             vheader = QTableWidgetItem(str(row))
@@ -64,17 +84,24 @@ class AdvancedTranslationTable(QTableWidget):
             self.setItem(row, 3, status)
 
             self.track_row_data(row)
-
-        header = self.horizontalHeader()
-        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        self.setUpdatesEnabled(True)
+        self.populated_count = end
+        if not self.is_populated():
+            QTimer.singleShot(0, self.populate_rows)
 
     def track_row_data(self, row):
+        # The row will be tracked once it is populated.
+        if self.item(row, 0) is None:
+            return
         paragraph = self.paragraph(row)
         original = paragraph.original.replace('\n', ' ')
         engine_name = paragraph.engine_name
         target_lang = paragraph.target_lang
         items = [original, '--', '--', _('Untranslated')]
+        was_translated = self.item(row, 3).text() == _('Translated')
         if paragraph.translation:
+            if not was_translated:
+                self.translated_count += 1
             before_aligned = paragraph.aligned
             self.parent.merge_enabled and self.check_line_alignment(paragraph)
             # If the alignment of before and after is the same, do nothing.
@@ -84,6 +111,8 @@ class AdvancedTranslationTable(QTableWidget):
                 self.non_aligned_count -= 1
             items = [original, engine_name, target_lang, _('Translated')]
         else:
+            if was_translated:
+                self.translated_count -= 1
             self.check_translation_error(paragraph)
         for column, text in enumerate(items):
             item = self.item(row, column)
@@ -179,6 +208,9 @@ class AdvancedTranslationTable(QTableWidget):
 
     def paragraph(self, row):
         item = self.item(row, 0)
+        # Rows cannot be deleted until all of them are populated.
+        if item is None and not self.is_populated():
+            return self.paragraphs[row]
         return item.data(Qt.UserRole)
 
     def current_paragraph(self):
@@ -250,16 +282,22 @@ class AdvancedTranslationTable(QTableWidget):
 
     def delete_selected_rows(self):
         paragraphs = self.get_selected_paragraphs()
-        if len(paragraphs) < 1:
+        if len(paragraphs) < 1 or not self.is_populated():
             return
         if self.rowCount() == len(paragraphs):
             return self.alert.pop(_('Retain at least one row.'), 'warning')
+        # Notify the selection change once instead of for every removed row.
+        blocked = self.blockSignals(True)
         self.setCurrentItem(
             self.item(paragraphs[-1].row + 1, 0) or
             self.item(paragraphs[0].row - 1, 0) or
             self.item(paragraphs[-1].row - 1, 0))
         for paragraph in reversed(paragraphs):
+            if self.item(paragraph.row, 3).text() == _('Translated'):
+                self.translated_count -= 1
             self.removeRow(paragraph.row)
+        self.blockSignals(blocked)
+        self.itemSelectionChanged.emit()
         self.parent.cache.ignore_paragraphs(paragraphs)
 
     def select_by_attribute(self, name, value):
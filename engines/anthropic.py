@@ -77,7 +77,7 @@ class ClaudeTranslate(GenAI):
         self.stream = self.config.get('stream', self.stream)
         self.model = self.config.get('model', self.model)
 
-    def _get_prompt(self):
+    def _get_prompt(self, batch=False):
         prompt = self.prompt.replace('<tlang>', self.target_lang)
         if self._is_auto_lang():
             prompt = prompt.replace('<slang>', 'detected language')
@@ -92,6 +92,8 @@ class ClaudeTranslate(GenAI):
         if self.merge_enabled:
             prompt += (' Ensure that placeholders matching the pattern '
                        '{{id_\\d+}} in the content are retained.')
+        if batch:
+            prompt += self.batch_prompt
         return prompt
 
     def get_models(self):
@@ -118,13 +120,13 @@ class ClaudeTranslate(GenAI):
 
         return headers
 
-    def get_body(self, text):
+    def get_body(self, text, batch=False):
         body = {
             'stream': self.stream,
             'max_tokens': 4096,
             'model': self.model,
             'top_k': self.top_k,
-            'system': self._get_prompt(),
+            'system': self._get_prompt(batch),
             'messages': [{'role': 'user', 'content': text}]
         }
         sampling_value = getattr(self, self.sampling)
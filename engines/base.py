@@ -1,12 +1,16 @@
+import re
+import time
 import os.path
+import threading
 from typing import Any
+from types import GeneratorType
 
 from mechanize import HTTPError
 from mechanize._response import response_seek_wrapper as Response
 from calibre.utils.localization import lang_as_iso639_1
 
 from ..lib.utils import traceback_error, request
-from ..lib.exception import UnexpectedResult
+from ..lib.exception import UnexpectedResult, TransientError
 
 from .languages import lang_directionality
 
@@ -14,6 +18,31 @@ from .languages import lang_directionality
 load_translations()
 
 
+class TokenCache:
+    """Share access tokens across translator instances until they expire.
+    Concurrent refreshes are coalesced into a single fetch by the lock.
+    """
+    def __init__(self):
+        self.tokens: dict[str, tuple[str, float]] = {}
+        self.lock = threading.Lock()
+
+    def get(self, name, fetch):
+        """:fetch: Callable returning a tuple of token and expiry timestamp."""
+        with self.lock:
+            token, expires_at = self.tokens.get(name, (None, 0.0))
+            if token is None or time.time() >= expires_at:
+                token, expires_at = fetch()
+                self.tokens[name] = (token, expires_at)
+            return token
+
+    def invalidate(self, name):
+        with self.lock:
+            self.tokens.pop(name, None)
+
+
+token_cache = TokenCache()
+
+
 class Base:
     name: str | None = None
     alias: str | None = None
@@ -29,13 +58,22 @@ class Base:
     api_key_hint = _('API Keys')
     api_key_pattern = r'^[^\s]+$'
     api_key_errors = ['401']
+    # HTTP status codes of the temporary errors, e.g. rate limiting.
+    transient_errors = (429, 500, 502, 503, 504)
     separator = '\n\n'
     support_html = False
+    # Pack multiple paragraphs into a single request, see translate_batch.
+    support_batch = False
+    batch_separator = '\n%%\n'
+    # Fallback for the responses altering the spaces around the separator.
+    batch_pattern = re.compile(r'^[ \t]*%%[ \t]*$', re.M)
     placeholder = ('{{{{id_{}}}}}', r'({{\s*)+id\s*_\s*{}\s*(\s*}})+')
     using_tip = None
 
     concurrency_limit: int = 0
     request_interval: float = 0.0
+    # Maximum requests per second shared by all workers, 0 means no limit.
+    request_rate: float = 0.0
     request_attempt: int = 3
     request_timeout: float = 10.0
     max_error_count: int = 10
@@ -57,6 +95,9 @@ class Base:
         request_interval = self.config.get('request_interval')
         if request_interval is not None:
             self.request_interval = request_interval
+        request_rate = self.config.get('request_rate')
+        if request_rate is not None:
+            self.request_rate = float(request_rate)
         request_attempt = self.config.get('request_attempt')
         if request_attempt is not None:
             self.request_attempt = int(request_attempt)
@@ -158,6 +199,9 @@ class Base:
     def set_concurrency_limit(self, limit):
         self.concurrency_limit = limit
 
+    def set_request_rate(self, rate):
+        self.request_rate = rate
+
     def set_request_attempt(self, limit):
         self.request_attempt = limit
 
@@ -176,28 +220,55 @@ class Base:
     def _is_auto_lang(self):
         return self._get_source_code() == 'auto'
 
-    def translate(self, content):
+    def _request(self, content, get_body, get_result):
         try:
             response = request(
-                url=self.get_endpoint(), data=self.get_body(content),
+                url=self.get_endpoint(), data=get_body(content),
                 headers=self.get_headers(), method=self.method,
                 timeout=self.request_timeout, proxy_uri=self.proxy_uri,
                 raw_object=self.stream)
-            return self.get_result(response)
+            return get_result(response)
         except Exception as e:
+            transient = isinstance(e, HTTPError) and \
+                e.code in self.transient_errors
+            # The traceback of a temporary error does not help to investigate.
+            error_message = str(e) if transient else traceback_error()
             # Combine the error messages for investigation.
-            error_message = traceback_error()
             if isinstance(e, HTTPError):
                 error_message += '\n\n' + e.read().decode('utf-8')
             elif not self.stream and 'response' in locals():
                 error_message += '\n\n' + response
             # Swap a valid API key if necessary.
             if self.need_swap_api_key(error_message) and self.swap_api_key():
-                return self.translate(content)
+                return self._request(content, get_body, get_result)
+            if transient:
+                raise TransientError(error_message)
             raise UnexpectedResult(
                 _('Can not parse returned response. Raw data: {}')
                 .format('\n\n' + error_message))
 
+    def warm_up(self):
+        """Prepare anything that can be reused by the following requests,
+        e.g. the access token, before the translation starts.
+        """
+        pass
+
+    def translate(self, content):
+        return self._request(content, self.get_body, self.get_result)
+
+    def translate_batch(self, contents):
+        """Translate multiple contents with a single request. The returned
+        list keeps the order of the given contents, but its length is not
+        guaranteed to match, so callers need to check it.
+        """
+        translations = self._request(
+            contents, self.get_batch_body, self.get_batch_result)
+        if len(translations) != len(contents):
+            result = self.batch_separator.join(translations)
+            translations = [
+                item.strip() for item in self.batch_pattern.split(result)]
+        return translations
+
     def get_endpoint(self):
         return self.endpoint
 
@@ -210,6 +281,15 @@ class Base:
     def get_result(self, response: Response | bytes | str):
         return response
 
+    def get_batch_body(self, contents):
+        return self.get_body(self.batch_separator.join(contents))
+
+    def get_batch_result(self, response):
+        result = self.get_result(response)
+        if isinstance(result, GeneratorType):
+            result = ''.join(result)
+        return [item.strip() for item in result.split(self.batch_separator)]
+
     def get_usage(self):
         return None
 
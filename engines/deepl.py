@@ -1,6 +1,7 @@
 import json
 import time
 import random
+from urllib.parse import urlencode
 
 from ..lib.utils import request
 
@@ -20,6 +21,7 @@ class DeeplTranslate(Base):
     # api_key_hint = 'xxx-xxx-xxx:fx'
     placeholder = ('<m id={} />', r'<m\s+id={}\s+/>')
     api_key_errors = ['403', '456']
+    support_batch = True
 
     def get_usage(self):
         # See: https://www.deepl.com/docs-api/general/get-usage/
@@ -52,6 +54,13 @@ class DeeplTranslate(Base):
     def get_result(self, response):
         return json.loads(response)['translations'][0]['text']
 
+    def get_batch_body(self, contents):
+        # Each content is sent as a repeated "text" parameter.
+        return urlencode(self.get_body(contents), doseq=True)
+
+    def get_batch_result(self, response):
+        return [item['text'] for item in json.loads(response)['translations']]
+
 
 class DeeplProTranslate(DeeplTranslate):
     name = 'DeepL(Pro)'
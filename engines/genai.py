@@ -5,6 +5,15 @@ from .base import Base
 
 class GenAI(Base, ABC):
     """Each GenAI model should inherit this class to use specific methods."""
+    support_batch = True
+    batch_prompt = (
+        ' The content is divided into segments by lines containing only '
+        '"%%". Translate each segment separately and keep every "%%" line '
+        'unchanged, so that the answer contains exactly the same number of '
+        'segments.')
+
+    def get_batch_body(self, contents):
+        return self.get_body(self.batch_separator.join(contents), True)
 
     @abstractmethod
     def get_models(self) -> list[str]:
@@ -8,7 +8,7 @@ from http.client import IncompleteRead
 
 from ..lib.utils import request, traceback_error
 
-from .base import Base
+from .base import Base, token_cache
 from .genai import GenAI
 from .languages import google, gemini
 
@@ -127,7 +127,6 @@ class GoogleFreeTranslate(Base):
 
 class GoogleTranslate(Base):
     api_key_errors = ['429']
-    api_key_cache: tuple[float, str | None] = (0.0, None)
     gcloud = None
     project_id = None
     using_tip = _(
@@ -197,13 +196,7 @@ class GoogleTranslate(Base):
             [self._get_gcloud_command(), 'config', 'get', 'project'])
         return self.project_id
 
-    def _get_credential(self):
-        """The default lifetime of the API key is 3600 seconds. Once an
-        available key is generated, it will be cached until it expired.
-        """
-        timestamp, old_api_key = self.api_key_cache
-        if old_api_key is not None and time.time() - timestamp < 3600:
-            return old_api_key
+    def _fetch_credential(self):
         # Temporarily add existing proxies.
         self.proxy_uri and os.environ.update(
             http_proxy=self.proxy_uri, https_proxy=self.proxy_uri)
@@ -214,8 +207,13 @@ class GoogleTranslate(Base):
         for proxy in ('http_proxy', 'https_proxy'):
             if proxy in os.environ:
                 del os.environ[proxy]
-        self.api_key_cache = (time.time(), new_api_key)
-        return new_api_key
+        return new_api_key, time.time() + 3600
+
+    def _get_credential(self):
+        """The default lifetime of the API key is 3600 seconds. Once an
+        available key is generated, it will be cached until it expired.
+        """
+        return token_cache.get('gcloud', self._fetch_credential)
 
 
 class GoogleBasicTranslateADC(GoogleTranslate):
@@ -274,6 +272,7 @@ class GoogleAdvancedTranslate(GoogleTranslate):
     endpoint = 'https://translation.googleapis.com/v3/projects/{}'
     api_key_hint = 'PROJECT_ID'
     need_api_key = False
+    support_batch = True
 
     def get_endpoint(self):
         return self.endpoint.format(
@@ -286,20 +285,30 @@ class GoogleAdvancedTranslate(GoogleTranslate):
             'x-goog-user-project': self._get_project_id(),
         }
 
-    def get_body(self, text):
+    def _create_body(self, contents):
         body = {
             'targetLanguageCode': self._get_target_code(),
-            'contents': [text],
+            'contents': contents,
             'mimeType': 'text/plain',
         }
         if not self._is_auto_lang():
             body.update(sourceLanguageCode=self._get_source_code())
         return json.dumps(body)
 
+    def get_body(self, text):
+        return self._create_body([text])
+
     def get_result(self, response):
         translations = json.loads(response)['translations']
         return ''.join(i['translatedText'] for i in translations)
 
+    def get_batch_body(self, contents):
+        return self._create_body(contents)
+
+    def get_batch_result(self, response):
+        translations = json.loads(response)['translations']
+        return [i['translatedText'] for i in translations]
+
 
 class GeminiTranslate(GenAI):
     name = 'Gemini'
@@ -343,7 +352,7 @@ class GeminiTranslate(GenAI):
         self.stream = self.config.get('stream', self.stream)
         self.model = self.config.get('model', self.model)
 
-    def _prompt(self, text):
+    def _prompt(self, text, batch=False):
         prompt = self.prompt.replace('<tlang>', self.target_lang)
         if self._is_auto_lang():
             prompt = prompt.replace('<slang>', 'detected language')
@@ -354,6 +363,8 @@ class GeminiTranslate(GenAI):
             prompt += (
                 ' Ensure that placeholders matching the pattern {{id_\\d+}} '
                 'in the content are retained.')
+        if batch:
+            prompt += self.batch_prompt
         return prompt + ' Start translating: ' + text
 
     def get_models(self):
@@ -380,10 +391,11 @@ class GeminiTranslate(GenAI):
     def get_headers(self):
         return {'Content-Type': 'application/json'}
 
-    def get_body(self, text):
+    def get_body(self, text, batch=False):
         return json.dumps({
             "contents": [
-                {"role": "user", "parts": [{"text": self._prompt(text)}]},
+                {"role": "user", "parts": [
+                    {"text": self._prompt(text, batch)}]},
             ],
             "generationConfig": {
                 # "stopSequences": ["Test"],
@@ -1,11 +1,13 @@
 import json
+import time
 import base64
 from datetime import datetime
 from urllib.parse import urlencode
 
 from ..lib.utils import request
+from ..lib.exception import UnexpectedResult
 
-from .base import Base
+from .base import Base, token_cache
 from .languages import microsoft
 from .openai import ChatgptTranslate
 
@@ -20,7 +22,10 @@ class MicrosoftEdgeTranslate(Base):
     lang_codes = Base.load_lang_codes(microsoft)
     endpoint = 'https://api-edge.cognitive.microsofttranslator.com/translate'
     need_api_key = False
-    access_info = None
+    support_batch = True
+    # The token is valid for 10 minutes, refresh it a bit earlier.
+    token_lifetime = 540
+    token_errors = ['401', '403']
 
     def _parse_jwt(self, token):
         parts = token.split(".")
@@ -36,14 +41,30 @@ class MicrosoftEdgeTranslate(Base):
         expired_date = datetime.fromtimestamp(parsed['exp'])
         return {'Token': token, 'Expire': expired_date}
 
+    def _fetch_app_key(self):
+        auth_url = 'https://edge.microsoft.com/translate/auth'
+        app_key = request(auth_url, method='GET')
+        expire = self._parse_jwt(app_key)['Expire'].timestamp()
+        return app_key, min(expire, time.time() + self.token_lifetime)
+
     def _get_app_key(self):
-        if not self.access_info or datetime.now() > self.access_info['Expire']:
-            auth_url = 'https://edge.microsoft.com/translate/auth'
-            app_key = request(auth_url, method='GET')
-            self.access_info = self._parse_jwt(app_key)
-        else:
-            app_key = self.access_info['Token']
-        return app_key
+        return token_cache.get(self.name, self._fetch_app_key)
+
+    def _request(self, content, get_body, get_result):
+        try:
+            return Base._request(self, content, get_body, get_result)
+        except UnexpectedResult as e:
+            if not any(error in str(e) for error in self.token_errors):
+                raise
+        # The cached token was revoked before it expired, retry only once.
+        token_cache.invalidate(self.name)
+        return Base._request(self, content, get_body, get_result)
+
+    def warm_up(self):
+        try:
+            self._get_app_key()
+        except Exception:
+            pass
 
     def get_endpoint(self):
         query = {
@@ -67,6 +88,13 @@ class MicrosoftEdgeTranslate(Base):
     def get_result(self, response):
         return json.loads(response)[0]['translations'][0]['text']
 
+    def get_batch_body(self, contents):
+        return json.dumps([{'text': content} for content in contents])
+
+    def get_batch_result(self, response):
+        return [item['translations'][0]['text']
+                for item in json.loads(response)]
+
 
 class AzureChatgptTranslate(ChatgptTranslate):
     name = 'ChatGPT(Azure)'
@@ -81,11 +109,11 @@ class AzureChatgptTranslate(ChatgptTranslate):
             'api-key': self.api_key
         }
 
-    def get_body(self, text):
+    def get_body(self, text, batch=False):
         body = {
             'stream': self.stream,
             'messages': [
-                {'role': 'system', 'content': self.get_prompt()},
+                {'role': 'system', 'content': self.get_prompt(batch)},
                 {'role': 'user', 'content': text}
             ]
         }
@@ -69,7 +69,7 @@ class ChatgptTranslate(GenAI):
             proxy_uri=self.proxy_uri)
         return [item['id'] for item in json.loads(response).get('data')]
 
-    def get_prompt(self):
+    def get_prompt(self, batch=False):
         prompt = self.prompt.replace('<tlang>', self.target_lang)
         if self._is_auto_lang():
             prompt = prompt.replace('<slang>', 'detected language')
@@ -79,6 +79,8 @@ class ChatgptTranslate(GenAI):
         if self.merge_enabled:
             prompt += (' Ensure that placeholders matching the pattern '
                        '{{id_\\d+}} in the content are retained.')
+        if batch:
+            prompt += self.batch_prompt
         return prompt
 
     def get_headers(self):
@@ -88,11 +90,11 @@ class ChatgptTranslate(GenAI):
             'User-Agent': 'Ebook-Translator/%s' % EbookTranslator.__version__
         }
 
-    def get_body(self, text):
+    def get_body(self, text, batch=False):
         body: dict[str, Any] = {
             'model': self.model,
             'messages': [
-                {'role': 'system', 'content': self.get_prompt()},
+                {'role': 'system', 'content': self.get_prompt(batch)},
                 {'role': 'user', 'content': text}
             ],
         }
@@ -8,7 +8,7 @@ import tempfile
 from datetime import datetime
 from glob import glob
 
-from .utils import size_by_unit
+from .utils import uid, size_by_unit, file_fingerprint
 from .config import get_config
 
 
@@ -127,6 +127,10 @@ class TranslationCache:
             total += os.path.getsize(file_path)
         return size_by_unit(total, 'MB')
 
+    @classmethod
+    def exists(cls, identity):
+        return os.path.exists(os.path.join(cls.cache_path, '%s.db' % identity))
+
     @classmethod
     def remove(cls, filename):
         file_path = os.path.join(cls.cache_path, filename)
@@ -282,6 +286,16 @@ class TranslationCache:
             engine_name=paragraph.engine_name,
             target_lang=paragraph.target_lang)
 
+    def update_paragraphs(self, paragraphs):
+        """Write the translations of the paragraphs in a single transaction."""
+        self.cursor.executemany(
+            'UPDATE cache SET translation=?, engine_name=?, target_lang=? '
+            'WHERE id=?', [(
+                paragraph.translation, paragraph.engine_name,
+                paragraph.target_lang, paragraph.id)
+                for paragraph in paragraphs])
+        self.connection.commit()
+
     def delete_paragraphs(self, paragraphs):
         self.delete([paragraph.id for paragraph in paragraphs])
 
@@ -289,5 +303,18 @@ class TranslationCache:
         self.ignore([paragraph.id for paragraph in paragraphs])
 
 
+def get_cache_id(input_path, engine_name, target_lang, merge_length, encoding):
+    """The ebook is identified by its content fingerprint. The identity based
+    on the input path is still used if only a legacy cache exists for it.
+    """
+    settings = engine_name + target_lang + merge_length + encoding
+    cache_id = uid(file_fingerprint(input_path) + settings)
+    legacy_id = uid(input_path + settings)
+    if not TranslationCache.exists(cache_id) and \
+            TranslationCache.exists(legacy_id):
+        return legacy_id
+    return cache_id
+
+
 def get_cache(uid):
     return TranslationCache(uid, get_config().get('cache_enabled'))
@@ -1,5 +1,9 @@
 import os
 import os.path
+import queue
+import threading
+from itertools import chain, groupby
+from operator import attrgetter
 from types import MethodType
 from typing import Callable
 from tempfile import gettempdir
@@ -16,8 +20,8 @@ from calibre.ebooks.metadata.meta import get_metadata, set_metadata
 from .. import EbookTranslator
 
 from .config import get_config
-from .utils import sep, uid, open_path, open_file
-from .cache import get_cache
+from .utils import sep, open_path, open_file
+from .cache import get_cache, get_cache_id
 from .element import (
     get_element_handler, get_srt_elements, get_toc_elements, get_page_elements,
     get_metadata_elements, get_pgn_elements)
@@ -151,16 +155,69 @@ extra_formats: dict[str, dict[str, Callable]] = {
 }
 
 
-def extract_item(input_path, input_format, encoding, callback=None):
+def stream_item(input_path, input_format, encoding, callback=None, maxsize=8):
+    """Extract the ebook in a background thread and yield its elements while
+    the extraction is still running. The elements are passed page by page
+    through a bounded queue, so the extraction never gets far ahead of the
+    consumer, and a page is only handed over once its tree has been walked.
+    """
     if callback is not None:
         log.outputs = [Stream(PrepareStream(callback))]
     handler = extra_formats.get(input_format)
-    extractor = extract_book if handler is None else handler['extractor']
-    return extractor(input_path, encoding)
-
+    if handler is not None:
+        yield from handler['extractor'](input_path, encoding)
+        return
+
+    chunks: queue.Queue = queue.Queue(maxsize)
+    stopped = threading.Event()
+    finished = object()
+
+    def put(item):
+        while not stopped.is_set():
+            try:
+                return chunks.put(item, timeout=0.1)
+            except queue.Full:
+                pass
+        raise ConversionAbort()
 
-def extract_book(input_path, encoding):
+    def consume(elements):
+        for page_id, page in groupby(elements, key=attrgetter('page_id')):
+            put(list(page))
+
+    def produce():
+        try:
+            extract_book(input_path, encoding, consume)
+            put(finished)
+        except ConversionAbort:
+            pass
+        except Exception as e:
+            try:
+                put(e)
+            except ConversionAbort:
+                pass
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            chunk = chunks.get()
+            if chunk is finished:
+                break
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield from chunk
+    finally:
+        # Release the producer if the consumer stops early.
+        stopped.set()
+        producer.join()
+
+
+def extract_book(input_path, encoding, consume=None):
+    """:consume: Callable to process the elements while the conversion is
+    still running, as the OEB data is only available during the conversion.
+    """
     elements = []
+    consume = consume or elements.extend
     output_path = os.path.join(gettempdir(), 'temp.epub')
     plumber = Plumber(input_path, output_path, log=log)
 
@@ -173,9 +230,10 @@ def extract_book(input_path, encoding):
         #             print(type(rule))
         #             # CSSStyleDeclaration
         #             print(rule.style.keys())
-        elements.extend(get_metadata_elements(oeb.metadata))
-        elements.extend(get_toc_elements(oeb.toc.nodes, []))
-        elements.extend(get_page_elements(oeb.manifest.items))
+        consume(chain(
+            get_metadata_elements(oeb.metadata),
+            get_toc_elements(oeb.toc.nodes, []),
+            get_page_elements(oeb.manifest.items)))
         raise ConversionAbort()
     plumber.output_plugin.convert = MethodType(convert, plumber.output_plugin)
     try:
@@ -204,8 +262,8 @@ def convert_item(
     _encoding = ''
     if encoding.lower() != 'utf-8':
         _encoding = encoding.lower()
-    cache_id = uid(
-        input_path + translator.name + target_lang + merge_length + _encoding)
+    cache_id = get_cache_id(
+        input_path, translator.name, target_lang, merge_length, _encoding)
     cache = get_cache(cache_id)
     cache.set_cache_only(cache_only)
     cache.set_info('title', ebook_title)
@@ -229,8 +287,10 @@ def convert_item(
     debug_info += '| Encoding: %s\n' % encoding
     debug_info += '| Cache Enabled: %s\n' % cache.is_persistence()
     debug_info += '| Merging Length: %s\n' % element_handler.merge_length
-    debug_info += '| Concurrent requests: %s\n' % translator.concurrency_limit
+    debug_info += '| Concurrent requests: %s\n' % (
+        translator.concurrency_limit or 'Unlimited')
     debug_info += '| Request Interval: %s\n' % translator.request_interval
+    debug_info += '| Request Rate: %s\n' % translator.request_rate
     debug_info += '| Request Attempt: %s\n' % translator.request_attempt
     debug_info += '| Request Timeout: %s\n' % translator.request_timeout
     debug_info += '| Input Path: %s\n' % input_path
@@ -2,6 +2,8 @@ import re
 import json
 import copy
 from typing import Any
+from itertools import chain
+from functools import lru_cache
 
 from lxml import etree
 from calibre import prepare_string_for_xml as xml_escape
@@ -12,17 +14,80 @@ from .utils import (
 from .config import get_config
 
 
+_RE_XMLNS = re.compile(r'\sxmlns="[^"]+"')
+_RE_CONDENSE = re.compile(r'((\w)\2{3})\2*')
+_RE_PGN = re.compile(r'\{[^}]*[A-Za-z][^}]*\}')
+_RE_ALPHA = re.compile(r'[a-zA-Z]+')
+
+_PAGE_EXTENSIONS = ('.xhtml', '.html', '.htm', '.xml', '.xht')
+# The default priority elements are plain tags, so they can be matched by the
+# tag name in Clark notation without evaluating XPath.
+_PRIORITY_TAGS = frozenset(
+    '{%s}%s' % (ns['x'], tag) for tag in (
+        'p', 'pre', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'blockquote'))
+
+
 def get_string(element, remove_ns=False):
     element.text = element.text or ''  # prevent auto-closing empty elements
     markup = trim(etree.tostring(
         element, encoding='utf-8', with_tail=False).decode('utf-8'))
-    return re.sub(r'\sxmlns="[^"]+"', '', markup) if remove_ns else markup
+    if remove_ns:
+        # Most elements only declare the XHTML namespace, which can be removed
+        # without scanning the markup with the regex.
+        markup = markup.replace(' xmlns="%s"' % ns['x'], '')
+        if 'xmlns="' in markup:
+            markup = _RE_XMLNS.sub('', markup)
+    return markup
 
 
 def get_name(element):
     return etree.QName(element).localname
 
 
+@lru_cache(maxsize=None)
+def get_xpath(expression):
+    """Compile the XPath expression only once, since the same patterns are
+    evaluated against every extracted element.
+    """
+    return etree.XPath(expression, namespaces=ns)
+
+
+@lru_cache(maxsize=None)
+def get_descendant_tags(expression):
+    """Return the tags in Clark notation if the expression created with
+    `create_xpath` only matches descendants by tag name, otherwise None.
+    """
+    match = re.match(r'^\.//\*\[(.+)\]$', expression)
+    if match is None:
+        return None
+    tags = []
+    for condition in match.group(1).split(' or '):
+        tag = re.match(r'^self::x:([\w-]+)$', condition)
+        if tag is None:
+            return None
+        tags.append('{%s}%s' % (ns['x'], tag.group(1)))
+    return tuple(tags)
+
+
+@lru_cache(maxsize=None)
+def get_reserve_pattern(placeholder):
+    """Compile the escaped placeholder pattern once per engine, capturing
+    the id of the reserved element.
+    """
+    return re.compile(xml_escape(placeholder).format(
+        r'(?P<rid>\d(?:\s*\d){4})'))
+
+
+def get_descendants(element, expression):
+    """Plain tag patterns are matched with the tag-filtered iterator, which
+    is much cheaper than evaluating the XPath expression.
+    """
+    tags = get_descendant_tags(expression)
+    if tags is None:
+        return get_xpath(expression)(element)
+    return list(element.iterdescendants(*tags))
+
+
 class Element:
     def __init__(self, element, page_id=None, ignored=False):
         self.element = element
@@ -43,14 +108,20 @@ class Element:
         self.remove_pattern = None
         self.reserve_pattern = None
 
+        self._raw = None
+        self._content = None
+
     def _element_copy(self):
-        return copy.deepcopy(self.element)
+        # The __copy__ of lxml already clones the whole subtree natively, so
+        # there is no need for the memo bookkeeping of copy.deepcopy.
+        return copy.copy(self.element)
 
     def set_ignored(self, ignored):
         self.ignored = ignored
 
     def set_placeholder(self, placeholder):
         self.placeholder = placeholder
+        self._content = None
 
     def set_column_gap(self, values):
         self.column_gap = values
@@ -72,9 +143,11 @@ class Element:
 
     def set_remove_pattern(self, pattern):
         self.remove_pattern = pattern
+        self._content = None
 
     def set_reserve_pattern(self, pattern):
         self.reserve_pattern = pattern
+        self._content = None
 
     def get_name(self):
         return None
@@ -196,14 +269,18 @@ class PageElement(Element):
         return get_name(self.element)
 
     def get_raw(self):
-        return get_string(self.element, True)
+        if self._raw is None:
+            self._raw = get_string(self.element, True)
+        return self._raw
 
     def get_text(self):
         return trim(''.join(self.element.itertext()))
 
     def get_attributes(self):
-        attributes = dict(self.element.attrib.items())
-        return json.dumps(attributes) if attributes else None
+        # Most of the elements have no attributes at all.
+        if len(self.element.attrib) == 0:
+            return None
+        return json.dumps(dict(self.element.attrib))
 
     def _safe_remove(self, element, replacement=''):
         previous, parent = element.getprevious(), element.getparent()
@@ -217,14 +294,18 @@ class PageElement(Element):
         parent.remove(element)
 
     def get_content(self):
+        # The content is needed for both extraction and translation, so only
+        # compute it (and collect the reserved elements) once.
+        if self._content is not None:
+            return self._content
+        self.reserve_elements = []
         element_copy = self._element_copy()
         if self.remove_pattern is not None:
-            for noise in element_copy.xpath(
-                    self.remove_pattern, namespaces=ns):
+            for noise in get_descendants(element_copy, self.remove_pattern):
                 self._safe_remove(noise)
         elements = []
         if self.reserve_pattern is not None:
-            elements = element_copy.xpath(self.reserve_pattern, namespaces=ns)
+            elements = get_descendants(element_copy, self.reserve_pattern)
         for eid, element in enumerate(elements):
             replacement = self.placeholder[0].format(format(eid, '05'))
             if get_name(element) in ('sub', 'sup'):
@@ -235,21 +316,38 @@ class PageElement(Element):
                     elements[eid] = element = parent
             self.reserve_elements.append(get_string(element, True))
             self._safe_remove(element, replacement)
-        return trim(''.join(element_copy.itertext()))
+        self._content = trim(''.join(element_copy.itertext()))
+        return self._content
+
+    def _restore_reserve(self, match):
+        rid = int(''.join(match.group('rid').split()))
+        if rid < len(self.reserve_elements):
+            # Prevent processe any backslash escapes in the replacement.
+            return self.reserve_elements[rid]
+        return match.group(0)
 
     def _polish_translation(self, translation):
         translation = translation.replace('\n', '<br/>')
         # Condense consecutive letters to a maximum of four.
-        return re.sub(r'((\w)\2{3})\2*', r'\1', translation)
+        return _RE_CONDENSE.sub(r'\1', translation)
 
     def _create_new_element(
             self, name, content='', copy_attrs=True, excluding_attrs=[]):
-        # Copy the namespaces from the original namespaces to the new ones.
-        namespaces = ' '.join(
-            'xmlns%s="%s"' % ('' if name is None else ':' + name, value)
-            for name, value in self.element.nsmap.items())
-        new_element = etree.XML('<{0} {1}>{2}</{0}>'.format(
-            name, namespaces, trim(content)))
+        content = trim(content)
+        nsmap = self.element.nsmap
+        # Only parse the content if it contains markups or entities; plain
+        # text can be assigned directly to a new element.
+        if '<' in content or '&' in content:
+            # Copy the namespaces from the original namespaces to the new ones.
+            namespaces = ' '.join(
+                'xmlns%s="%s"' % ('' if name is None else ':' + name, value)
+                for name, value in nsmap.items())
+            new_element = etree.XML('<{0} {1}>{2}</{0}>'.format(
+                name, namespaces, content))
+        else:
+            tag = name if None not in nsmap else '{%s}%s' % (nsmap[None], name)
+            new_element = self.element.makeelement(tag, nsmap=nsmap)
+            new_element.text = content or None
         # Preserve all attributes from the original element.
         if copy_attrs:
             for name, value in self.element.items():
@@ -267,6 +365,8 @@ class PageElement(Element):
 
     def add_translation(self, translation=None):
         # self.element.tail = None  # Make sure the element has no tail
+        # The element is about to change, so drop the memoized markups.
+        self._raw = self._content = None
         if self.original_color is not None:
             for element in self.element.iter():
                 if element.text is not None or len(list(element)) > 0:
@@ -290,12 +390,10 @@ class PageElement(Element):
 
         # Escape the markups (<m id=1 />) to replace escaped markups.
         translation = xml_escape(translation)
-        for rid, element in enumerate(self.reserve_elements):
-            pattern = self.placeholder[1].format(
-                r'\s*'.join(format(rid, '05')))
-            # Prevent processe any backslash escapes in the replacement.
-            translation = re.sub(
-                xml_escape(pattern), lambda _: element, translation)
+        if len(self.reserve_elements) > 0:
+            # Restore all of the reserved elements in a single pass.
+            pattern = get_reserve_pattern(self.placeholder[1])
+            translation = pattern.sub(self._restore_reserve, translation)
         translation = self._polish_translation(translation)
 
         element_name = get_name(self.element)
@@ -457,10 +555,12 @@ class PageElement(Element):
                     new_br.addprevious(wrapper)
 
     def _create_table(self, translation=None):
-        # table = self.element.makeelement('table', attrib={'width': '100%'})
         original = self._element_copy()
-        table = etree.XML(
-            '<table xmlns="{}" width="100%"></table>'.format(ns['x']))
+        # Create the table within the document of the element instead of
+        # parsing a new document for it.
+        table = self.element.makeelement(
+            '{%s}table' % ns['x'], attrib={'width': '100%'},
+            nsmap={None: ns['x']})
         tr = etree.SubElement(table, 'tr')
         td_left = etree.SubElement(tr, 'td', attrib={'valign': 'top'})
         td_middle = etree.SubElement(tr, 'td')
@@ -504,6 +604,9 @@ class Extraction:
 
         self.priority_patterns = []
         self.filter_patterns = []
+        self.filter_literals = []
+        self.filter_ignore_case = False
+        self.filter_pattern = None
         self.ignore_patterns = []
 
         self.load_priority_patterns()
@@ -511,86 +614,121 @@ class Extraction:
         self.load_ignore_patterns()
 
     def load_priority_patterns(self):
-        default_selectors = [
-            'p', 'pre', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'blockquote']
-        self.priority_patterns = css_to_xpath(
-            default_selectors + self.priority_rules)
+        self.priority_patterns = [
+            get_xpath(pattern) for pattern in css_to_xpath(
+                self.priority_rules)]
 
     def load_filter_patterns(self):
         default_filter_rules = (
             r'^[-\d\s\.\'\\"‘’“”,=~!@#$%^&º*|≈<>?/`—…+:–_(){}[\]]+$',)
         patterns = [re.compile(rule) for rule in default_filter_rules]
+        literals = []
+        # The rules in normal and case modes are plain text, so they are
+        # checked as substrings without involving the regex engine.
         for rule in self.filter_rules:
             if self.rule_mode == 'normal':
-                rule = re.compile(re.escape(rule), re.I)
+                literals.append(rule.lower())
             elif self.rule_mode == 'case':
-                rule = re.compile(re.escape(rule))
+                literals.append(rule)
             else:
-                rule = re.compile(rule)
-            patterns.append(rule)
+                patterns.append(re.compile(rule))
         self.filter_patterns = patterns
+        self.filter_literals = literals
+        self.filter_ignore_case = self.rule_mode == 'normal'
+        self.filter_pattern = self.combine_patterns(patterns)
+
+    def combine_patterns(self, patterns):
+        """Combine the patterns into a single alternation so that the content
+        only needs to be scanned once. Patterns with groups are not combined
+        since their backreferences would be renumbered.
+        """
+        alternatives = []
+        for pattern in patterns:
+            if pattern.groups > 0:
+                return None
+            flags = 'i' if pattern.flags & re.I else ''
+            alternatives.append('(?%s:%s)' % (flags, pattern.pattern))
+        try:
+            return re.compile('|'.join(alternatives))
+        except re.error:
+            return None
+
+    def match_filter(self, text):
+        if len(self.filter_literals) > 0:
+            haystack = text.lower() if self.filter_ignore_case else text
+            if any(literal in haystack for literal in self.filter_literals):
+                return True
+        if self.filter_pattern is not None:
+            return self.filter_pattern.search(text) is not None
+        return any(pattern.search(text) for pattern in self.filter_patterns)
 
     def load_ignore_patterns(self):
         default_selectors = ['pre', 'code']
-        self.ignore_patterns = css_to_xpath(
-            default_selectors + self.ignore_rules)
+        self.ignore_patterns = [
+            get_xpath(pattern) for pattern in css_to_xpath(
+                default_selectors + self.ignore_rules)]
 
     def get_sorted_pages(self):
-        pages = []
-        pattern = re.compile(r'\.(xhtml|html|htm|xml|xht)$')
-        for page in self.pages:
-            if isinstance(page.data, etree._Element) \
-                    and pattern.search(page.href):
-                pages.append(page)
+        pages = [
+            page for page in self.pages
+            if isinstance(page.data, etree._Element)
+            and page.href.endswith(_PAGE_EXTENSIONS)]
         return sorted(pages, key=lambda page: sorted_mixed_keys(page.href))
 
     def get_elements(self):
-        elements = []
+        """Yield the elements page by page, so that consumers can start
+        processing before all pages are extracted.
+        """
         for page in self.get_sorted_pages():
             body = page.data.find('./x:body', namespaces=ns)
-            elements.extend(self.extract_elements(page.id, body, []))
-        return filter(self.filter_content, elements)
+            for element in self.extract_elements(page.id, body):
+                if self.filter_content(element):
+                    yield element
 
     def is_priority(self, element):
+        if element.tag in _PRIORITY_TAGS:
+            return True
         for pattern in self.priority_patterns:
-            if element.xpath(pattern, namespaces=ns):
+            if pattern(element):
                 return True
         return False
 
     def need_ignore(self, element):
         for pattern in self.ignore_patterns:
-            if element.xpath(pattern, namespaces=ns):
+            if pattern(element):
                 return True
         return False
 
-    def extract_elements(self, page_id, root, elements=[]):
+    def extract_elements(self, page_id, root, elements=None):
         """If the root matches the pattern, return an empty list; otherwise,
-        just break the recursion without doing anything.
+        walk through the descendants with a stack instead of recursion.
         """
+        elements = [] if elements is None else elements
         if self.need_ignore(root):
             return []
-        for element in root.findall('./*'):
+        # Keep the children reversed so they are popped in document order.
+        stack = root.findall('./*')[::-1]
+        while stack:
+            element = stack.pop()
             if self.need_ignore(element):
                 elements.append(PageElement(element, page_id, True))
                 continue
             element_has_content = False
+            children = []
             if self.is_priority(element) or (
                     element.text is not None and trim(element.text) != ''):
                 element_has_content = True
             else:
                 children = element.findall('./*')
-                if children and self.is_priority(element):
-                    element_has_content = True
-                else:
-                    for child in children:
-                        if child.tail is not None and trim(child.tail) != '':
-                            element_has_content = True
-                            break
+                for child in children:
+                    if child.tail is not None and trim(child.tail) != '':
+                        element_has_content = True
+                        break
             if element_has_content:
                 elements.append(PageElement(
                     element, page_id, self.need_ignore(element)))
             else:
-                self.extract_elements(page_id, element, elements)
+                stack.extend(reversed(children))
         # Return root if all children have no content
         return elements if elements else [
             PageElement(root, page_id, self.need_ignore(root))]
@@ -600,17 +738,17 @@ class Extraction:
         content = element.get_text()
         if content == '':
             return False
-        for entity in ('&lt;', '&gt;'):
-            content = content.replace(entity, '')
-        for pattern in self.filter_patterns:
-            if pattern.search(content):
-                element.set_ignored(True)
+        # No need to check the rules for elements that are already ignored.
+        if element.ignored:
+            return True
+        if '&' in content:
+            content = content.replace('&lt;', '').replace('&gt;', '')
+        if self.match_filter(content):
+            element.set_ignored(True)
         # Filter HTML according to the rules
-        if self.filter_scope == 'html':
-            markup = element.get_raw()
-            for pattern in self.filter_patterns:
-                if pattern.search(markup):
-                    element.set_ignored(True)
+        elif self.filter_scope == 'html':
+            if self.match_filter(element.get_raw()):
+                element.set_ignored(True)
         return True
 
 
@@ -687,7 +825,7 @@ class ElementHandler:
             # may only contain ignored elements.
             if content.strip() == '':
                 element.set_ignored(True)
-            md5 = uid('%s%s' % (oid, content))
+            md5 = uid(str(oid), content)
             attrs = element.get_attributes()
             if not element.ignored:
                 self.elements[count] = element
@@ -698,14 +836,14 @@ class ElementHandler:
         return self.originals
 
     def prepare_translation(self, paragraphs):
-        translations = {}
-        for paragraph in paragraphs:
-            translations[paragraph.original] = paragraph.translation
-        return translations
+        return {
+            paragraph.original: paragraph.translation
+            for paragraph in paragraphs}
 
     def add_translations(self, paragraphs):
         translations = self.prepare_translation(paragraphs)
-        for eid, element in self.elements.copy().items():
+        translated = []
+        for eid, element in self.elements.items():
             if element.ignored:
                 element.add_translation()
                 continue
@@ -715,13 +853,22 @@ class ElementHandler:
                 element.add_translation()
                 continue
             element.add_translation(translation)
-            self.elements.pop(eid)
+            translated.append(eid)
+        for eid in translated:
+            del self.elements[eid]
 
 
 class ElementHandlerMerge(ElementHandler):
+    def __init__(self, placeholder, separator, position):
+        ElementHandler.__init__(self, placeholder, separator, position)
+        self.placeholder_pattern = re.compile(
+            r'\s*%s\s*' % self.placeholder[1].format(r'(0|[^0]\d*)'))
+        self.separator_pattern = re.compile('%s+' % self.separator)
+
     def prepare_original(self, elements):
-        raw = ''
-        txt = ''
+        # Collect the pieces of each merged paragraph in lists and join them
+        # only once, since concatenating strings repeatedly is quadratic.
+        raw_parts, txt_parts, txt_length = [], [], 0
         oid = 0
         for eid, element in enumerate(elements):
             self.elements[eid] = element
@@ -740,26 +887,27 @@ class ElementHandlerMerge(ElementHandler):
             code = element.get_raw()
             content = element.get_content()
             content += self.separator
-            if len(txt + content) < self.merge_length:
-                raw += code + self.separator
-                txt += content
+            if txt_length + len(content) < self.merge_length:
+                raw_parts.extend((code, self.separator))
+                txt_parts.append(content)
+                txt_length += len(content)
                 continue
-            elif txt:
-                md5 = uid('%s%s' % (oid, txt))
+            elif txt_length > 0:
+                raw, txt = ''.join(raw_parts), ''.join(txt_parts)
+                md5 = uid(str(oid), txt)
                 self.originals.append((oid, md5, raw, txt, False))
                 oid += 1
-            raw = code
-            txt = content
-        md5 = uid('%s%s' % (oid, txt))
-        if txt:
+            raw_parts, txt_parts, txt_length = [code], [content], len(content)
+        if txt_length > 0:
+            raw, txt = ''.join(raw_parts), ''.join(txt_parts)
+            md5 = uid(str(oid), txt)
             self.originals.append((oid, md5, raw, txt, False))
         return self.originals
 
     def align_paragraph(self, paragraph):
         # Compatible with using the placeholder as the separator.
         if paragraph.original[-2:] != self.separator:
-            pattern = re.compile(
-                r'\s*%s\s*' % self.placeholder[1].format(r'(0|[^0]\d*)'))
+            pattern = self.placeholder_pattern
             paragraph.original = pattern.sub(
                 self.separator, paragraph.original)
             if paragraph.translation is not None:
@@ -769,8 +917,8 @@ class ElementHandlerMerge(ElementHandler):
         originals = paragraph.original.strip().split(self.separator)
         if paragraph.translation is None:
             return list(zip(originals, [None] * len(originals)))
-        pattern = re.compile('%s+' % self.separator)
-        translation = pattern.sub(self.separator, paragraph.translation)
+        translation = self.separator_pattern.sub(
+            self.separator, paragraph.translation)
         translations: list[Any] = translation.strip().split(self.separator)
         offset = len(originals) - len(translations)
         if offset > 0:
@@ -791,10 +939,8 @@ class ElementHandlerMerge(ElementHandler):
         return list(zip(originals, translations))
 
     def prepare_translation(self, paragraphs):
-        translations = []
-        for paragraph in paragraphs:
-            translations.extend(self.align_paragraph(paragraph))
-        return dict(translations)
+        return dict(chain.from_iterable(
+            self.align_paragraph(paragraph) for paragraph in paragraphs))
 
 
 def get_srt_elements(path, encoding):
@@ -810,9 +956,9 @@ def get_srt_elements(path, encoding):
 
 
 def get_pgn_elements(path, encoding):
-    pattern = re.compile(r'\{[^}]*[a-zA-z][^}]*\}')
-    originals = pattern.findall(open_file(path, encoding))
-    return [PgnElement([original, None]) for original in originals]
+    return [
+        PgnElement([match.group(0), None])
+        for match in _RE_PGN.finditer(open_file(path, encoding))]
 
 
 def get_metadata_elements(metadata):
@@ -823,13 +969,12 @@ def get_metadata_elements(metadata):
     names = (
         'title', 'creator', 'publisher', 'rights', 'subject', 'contributor',
         'description')
-    pattern = re.compile(r'[a-zA-Z]+')
     for key in metadata.iterkeys():
         if key not in names:
             continue
         items = getattr(metadata, key)
         for item in items:
-            if pattern.search(item.content) is None:
+            if _RE_ALPHA.search(item.content) is None:
                 continue
             element = MetadataElement(
                 item, page_id='content.opf', ignored=not enable_translation)
@@ -837,8 +982,9 @@ def get_metadata_elements(metadata):
     return elements
 
 
-def get_toc_elements(nodes, elements=[]):
+def get_toc_elements(nodes, elements=None):
     """Be aware that elements should not overlap with existing data."""
+    elements = [] if elements is None else elements
     for node in nodes:
         elements.append(TocElement(node, 'toc.ncx'))
         if len(node.nodes) > 0:
@@ -2,6 +2,10 @@ class UnexpectedResult(Exception):
     pass
 
 
+class TransientError(UnexpectedResult):
+    pass
+
+
 class ConversionFailed(Exception):
     pass
 
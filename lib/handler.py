@@ -1,11 +1,44 @@
+import os
 import sys
+import time
 import asyncio
+import threading
 import concurrent.futures
 
 from .utils import traceback_error
 from .exception import TranslationCanceled
 
 
+class RequestQueue:
+    """Token bucket shared by the translation workers, so that the number of
+    requests per second stays under the rate limit of the engine no matter
+    how many of them are running concurrently.
+    """
+    def __init__(self, rate, capacity=1):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self):
+        """Take a token and return the seconds to wait before it is usable."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def acquire(self):
+        if self.rate <= 0:
+            return
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+
 class Handler:
     def __init__(self, paragraphs, concurrency_limit, translate_paragraph,
                  process_translation, request_interval):
@@ -24,17 +57,34 @@ class Handler:
         for paragraph in paragraphs:
             self.queue.put_nowait(paragraph)
 
-        self.concurrency_limit = concurrency_limit or self.queue.qsize()
+        # No limit (0) means one worker for each paragraph.
+        self.concurrency_limit = max(
+            1, min(concurrency_limit or self.queue.qsize(),
+                   self.queue.qsize()))
+        # The unlimited workers share as many threads as the default executor
+        # of asyncio would use, instead of one thread for each of them.
+        self.thread_count = self.concurrency_limit
+        if concurrency_limit < 1:
+            self.thread_count = min(
+                self.concurrency_limit, 32, (os.cpu_count() or 1) + 4)
         self.translate_paragraph = translate_paragraph
         self.process_translation = process_translation
         self.request_interval = request_interval
 
+        # Run the requests in a pool sized to the concurrency limit instead of
+        # the default executor, and process the results in a single thread.
+        self.translation_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.thread_count)
+        self.processing_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1)
+
     async def translation_worker(self):
         while True:
             try:
                 paragraph = await self.queue.get()
                 await asyncio.get_running_loop().run_in_executor(
-                    None, self.translate_paragraph, paragraph)
+                    self.translation_pool, self.translate_paragraph,
+                    paragraph)
                 paragraph.error = None
                 if self.queue.qsize() > 0 and not paragraph.is_cache:
                     await asyncio.sleep(self.request_interval)
@@ -57,9 +107,8 @@ class Handler:
     async def processing_worker(self):
         while True:
             paragraph = await self.done_queue.get()
-            with concurrent.futures.ThreadPoolExecutor() as pool:
-                await asyncio.get_running_loop().run_in_executor(
-                    pool, self.process_translation, paragraph)
+            await asyncio.get_running_loop().run_in_executor(
+                self.processing_pool, self.process_translation, paragraph)
             self.done_queue.task_done()
 
     async def create_tasks(self):
@@ -82,4 +131,8 @@ class Handler:
             pass
 
     def handle(self):
-        self.loop.run_until_complete(self.process_tasks())
+        try:
+            self.loop.run_until_complete(self.process_tasks())
+        finally:
+            self.translation_pool.shutdown(wait=False)
+            self.processing_pool.shutdown(wait=False)
@@ -1,6 +1,8 @@
 import re
 import time
 import json
+import threading
+from collections import deque
 from types import GeneratorType
 
 from ..engines import builtin_engines
@@ -10,8 +12,9 @@ from ..engines.custom import CustomTranslate
 
 from .utils import sep, trim, dummy, traceback_error
 from .config import get_config
-from .exception import TranslationFailed, TranslationCanceled
-from .handler import Handler
+from .exception import (
+    TranslationFailed, TranslationCanceled, TransientError)
+from .handler import Handler, RequestQueue
 
 
 load_translations()
@@ -69,6 +72,43 @@ class ProgressBar:
         return self._count
 
 
+class BatchConfig:
+    """Limits for packing paragraphs into a single translation request."""
+    def __init__(self, max_chars=4000, max_items=25):
+        self.max_chars = max_chars
+        self.max_items = max_items
+
+    def pack(self, paragraphs):
+        """Greedily pack the paragraphs into batches in their original order.
+        A paragraph longer than the character budget gets its own batch.
+        """
+        batches = []
+        batch = []
+        length = 0
+        for paragraph in paragraphs:
+            size = len(paragraph.original)
+            if batch and (length + size > self.max_chars
+                          or len(batch) >= self.max_items):
+                batches.append(Batch(batch))
+                batch = []
+                length = 0
+            batch.append(paragraph)
+            length += size
+        if batch:
+            batches.append(Batch(batch))
+        return batches
+
+
+class Batch:
+    def __init__(self, paragraphs):
+        self.paragraphs = paragraphs
+        self.error = None
+
+    @property
+    def is_cache(self):
+        return all(paragraph.is_cache for paragraph in self.paragraphs)
+
+
 class Translation:
     def __init__(self, translator, glossary):
         self.translator = translator
@@ -76,6 +116,8 @@ class Translation:
 
         self.fresh = False
         self.batch = False
+        self.batch_config = None
+        self.request_queue = None
         self.progress = dummy
         self.log = dummy
         self.streaming = dummy
@@ -85,6 +127,9 @@ class Translation:
         self.total = 0
         self.progress_bar = ProgressBar()
         self.abort_count = 0
+        # Recently logged temporary errors, to avoid flooding the log.
+        self.recent_errors: deque = deque(maxlen=200)
+        self.recent_errors_lock = threading.Lock()
 
     def set_fresh(self, fresh):
         self.fresh = fresh
@@ -92,6 +137,9 @@ class Translation:
     def set_batch(self, batch):
         self.batch = batch
 
+    def set_batch_config(self, batch_config):
+        self.batch_config = batch_config
+
     def set_progress(self, progress):
         self.progress = progress
 
@@ -112,6 +160,19 @@ class Translation:
         return self.translator.max_error_count > 0 and \
             self.abort_count >= self.translator.max_error_count
 
+    def is_repeated_error(self, message, window=1.0):
+        """Check if the same error was logged within the window in seconds,
+        e.g. by the other workers hitting the same rate limit.
+        """
+        key = hash(message)
+        now = time.time()
+        with self.recent_errors_lock:
+            for logged_key, logged_at in self.recent_errors:
+                if logged_key == key and now - logged_at < window:
+                    return True
+            self.recent_errors.append((key, now))
+        return False
+
     def translate_text(self, row, text, retry=0, interval=0):
         """Translation engine service error code documentation:
         * https://cloud.google.com/apis/design/errors
@@ -123,7 +184,12 @@ class Translation:
         if self.cancel_request():
             raise TranslationCanceled(_('Translation canceled.'))
         try:
-            translation = self.translator.translate(text)
+            if self.request_queue is not None:
+                self.request_queue.acquire()
+            if isinstance(text, list):
+                translation = self.translator.translate_batch(text)
+            else:
+                translation = self.translator.translate(text)
             self.abort_count = 0
             return translation
         except Exception as e:
@@ -137,15 +203,21 @@ class Translation:
             retry += 1
             interval += 5
             # Logging any errors that occur during translation.
-            logged_text = text[:200] + '...' if len(text) > 200 else text
-            error_messages = [
-                sep(), _('Original: {}').format(logged_text), sep('┈'),
-                _('Status: Failed {} times / Sleeping for {} seconds')
-                .format(retry, interval), sep('┈'), _('Error: {}')
-                .format(traceback_error())]
-            if row >= 0:
-                error_messages.insert(1, _('Row: {}').format(row))
-            self.log('\n'.join(error_messages), True)
+            transient = isinstance(e, TransientError)
+            if not transient or not self.is_repeated_error(str(e)):
+                logged_text = text
+                if isinstance(text, list):
+                    logged_text = self.translator.batch_separator.join(text)
+                if len(logged_text) > 200:
+                    logged_text = logged_text[:200] + '...'
+                error_messages = [
+                    sep(), _('Original: {}').format(logged_text), sep('┈'),
+                    _('Status: Failed {} times / Sleeping for {} seconds')
+                    .format(retry, interval), sep('┈'), _('Error: {}')
+                    .format(str(e) if transient else traceback_error())]
+                if row >= 0:
+                    error_messages.insert(1, _('Row: {}').format(row))
+                self.log('\n'.join(error_messages), True)
             if self.translator.match_error(str(e)):
                 raise TranslationCanceled(_('Translation canceled.'))
             time.sleep(interval)
@@ -164,19 +236,20 @@ class Translation:
         # Process streaming text
         if isinstance(translation, GeneratorType):
             if self.total == 1:
-                # Only for a single translation.
-                temp = ''
-                clear = True
+                # Only for a single translation. The chunks are passed on as
+                # soon as they arrive, the receiver coalesces the repaints.
+                chunks = []
                 for char in translation:
-                    if clear:
+                    if not chunks:
                         self.streaming('')
-                        clear = False
                     self.streaming(char)
-                    time.sleep(0.05)
-                    temp += char
+                    chunks.append(char)
+                translation = ''.join(chunks)
             else:
-                temp = ''.join([char for char in translation])
-            translation = temp
+                translation = ''.join(translation)
+        self._set_translation(paragraph, translation)
+
+    def _set_translation(self, paragraph, translation):
         translation = self.glossary.restore(translation)
         paragraph.translation = translation.strip()
         # Apply aligment checking and processing.
@@ -186,6 +259,46 @@ class Translation:
         paragraph.target_lang = self.translator.get_target_lang()
         paragraph.is_cache = False
 
+    def translate_batch(self, batch):
+        """Translate the paragraphs of the batch with a single request. If the
+        engine does not return one translation per paragraph, fall back to
+        translating them one by one instead of guessing the alignment.
+        """
+        if self.cancel_request():
+            raise TranslationCanceled(_('Translation canceled.'))
+        paragraphs = []
+        for paragraph in batch.paragraphs:
+            paragraph.error = None
+            if paragraph.translation and not self.fresh:
+                paragraph.is_cache = True
+                continue
+            paragraphs.append(paragraph)
+        if len(paragraphs) > 1:
+            self.streaming('')
+            self.streaming(_('Translating...'))
+            texts = [self.glossary.replace(p.original) for p in paragraphs]
+            translations = self.translate_text(paragraphs[0].row, texts)
+            if len(translations) == len(paragraphs):
+                for paragraph, translation in zip(paragraphs, translations):
+                    self._set_translation(paragraph, translation)
+                return
+            self.log(_(
+                'The number of translations does not match the number of '
+                'paragraphs, translating them one by one.'))
+        for paragraph in paragraphs:
+            try:
+                self.translate_paragraph(paragraph)
+            except TranslationCanceled:
+                raise
+            except Exception:
+                paragraph.error = traceback_error()
+
+    def process_batch(self, batch):
+        for paragraph in batch.paragraphs:
+            if batch.error is not None and not paragraph.is_cache:
+                paragraph.error = batch.error
+            self.process_translation(paragraph)
+
     def process_translation(self, paragraph):
         self.progress(
             self.progress_bar.length, _('Translating: {}/{}').format(
@@ -224,10 +337,19 @@ class Translation:
             raise Exception(_('There is no content need to translate.'))
         self.progress_bar.load(self.total)
 
-        handler = Handler(
-            paragraphs, self.translator.concurrency_limit,
-            self.translate_paragraph, self.process_translation,
-            self.translator.request_interval)
+        if self.translator.request_rate > 0:
+            self.request_queue = RequestQueue(self.translator.request_rate)
+        if self.batch_config is not None and self.total > 1:
+            handler = Handler(
+                self.batch_config.pack(paragraphs),
+                self.translator.concurrency_limit, self.translate_batch,
+                self.process_batch, self.translator.request_interval)
+        else:
+            handler = Handler(
+                paragraphs, self.translator.concurrency_limit,
+                self.translate_paragraph, self.process_translation,
+                self.translator.request_interval)
+        self.log(_('Concurrent requests: {}').format(handler.thread_count))
         handler.handle()
 
         self.log(sep())
@@ -275,6 +397,9 @@ def get_translation(translator, log=None):
     if config.get('glossary_enabled'):
         glossary.load_from_file(config.get('glossary_path'))
     translation = Translation(translator, glossary)
+    # Merged paragraphs are already packed up to the merge length.
+    if translator.support_batch and not translator.merge_enabled:
+        translation.set_batch_config(BatchConfig())
     if get_config().get('log_translation'):
         translation.set_logging(log)
     return translation
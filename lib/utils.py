@@ -1,9 +1,11 @@
+import os
 import re
 import sys
 import ssl
 import socket
 import hashlib
 import traceback
+from functools import lru_cache
 from subprocess import Popen
 
 from calibre import get_proxies
@@ -52,7 +54,31 @@ def uid(*args):
     return md5.hexdigest()
 
 
+def file_fingerprint(path):
+    """Identify a file by its content instead of its path, so a renamed or
+    re-imported ebook is still recognized.
+    """
+    stat = os.stat(path)
+    return _file_fingerprint(path, stat.st_mtime, stat.st_size)
+
+
+@lru_cache(maxsize=32)
+def _file_fingerprint(path, mtime, size):
+    blake2b = hashlib.blake2b()
+    with open(path, 'rb') as file:
+        for data in iter(lambda: file.read(1048576), b''):
+            blake2b.update(data)
+    return blake2b.hexdigest()
+
+
+_RE_UNCLEAN = re.compile(r'\s\s|[^\S ]|[\x00-\x1f\x7f-\xa0\xad\u200b\ufeff]')
+
+
 def trim(text):
+    # Most of the text is already clean, so skip the substitutions if none
+    # of them would change anything.
+    if text == text.strip() and _RE_UNCLEAN.search(text) is None:
+        return text
     # Replace \xa0 with whitespace to be compatible with Python 2.x.
     text = re.sub(u'\u00a0|\u3000', ' ', text)
     # Remove the \x07 from the translation generated by some engine.
@@ -136,22 +162,30 @@ def traceback_error():
     return traceback.format_exc(chain=False).strip()
 
 
+@lru_cache(maxsize=None)
+def ssl_context():
+    """Share one SSL context between requests instead of creating it for
+    every request.
+    """
+    # Do not verify SSL certificates
+    return ssl._create_unverified_context(cert_reqs=ssl.CERT_NONE)
+
+
 def request(
         url, data=None, headers={}, method='GET', timeout=30, proxy_uri=None,
         raw_object=False) -> Response | str:
     br = Browser()
     br.set_handle_robots(False)
-    # Do not verify SSL certificates
-    br.set_ca_data(
-        context=ssl._create_unverified_context(cert_reqs=ssl.CERT_NONE))
+    br.set_ca_data(context=ssl_context())
     # Set up proxy
     proxies: dict = {}
     if proxy_uri is not None:
         proxies.update(http=proxy_uri, https=proxy_uri)
     else:
-        http = get_proxies(False).get('http')
+        system_proxies = get_proxies(False)
+        http = system_proxies.get('http')
         http and proxies.update(http=http, https=http)
-        https = get_proxies(False).get('https')
+        https = system_proxies.get('https')
         https and proxies.update(https=https)
     proxies and br.set_proxies(proxies)
     _request = Request(
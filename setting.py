@@ -429,6 +429,9 @@ class TranslationSetting(QDialog):
         request_interval = QDoubleSpinBox()
         request_interval.setRange(0, 9999)
         request_interval.setDecimals(1)
+        request_rate = QDoubleSpinBox()
+        request_rate.setRange(0, 9999)
+        request_rate.setDecimals(1)
         request_attempt = QSpinBox()
         request_attempt.setRange(0, 9999)
         request_timeout = QDoubleSpinBox()
@@ -437,6 +440,7 @@ class TranslationSetting(QDialog):
         request_layout = QFormLayout(request_group)
         request_layout.addRow(_('Concurrency limit'), concurrency_limit)
         request_layout.addRow(_('Interval (seconds)'), request_interval)
+        request_layout.addRow(_('Rate limit (requests/second)'), request_rate)
         request_layout.addRow(_('Attempt times'), request_attempt)
         request_layout.addRow(_('Timeout (seconds)'), request_timeout)
         layout.addWidget(request_group)
@@ -458,6 +462,7 @@ class TranslationSetting(QDialog):
         self.disable_wheel_event(concurrency_limit)
         self.disable_wheel_event(request_attempt)
         self.disable_wheel_event(request_interval)
+        self.disable_wheel_event(request_rate)
         self.disable_wheel_event(request_timeout)
 
         # GenAI Setting
@@ -694,6 +699,10 @@ class TranslationSetting(QDialog):
             if value is None:
                 value = self.current_engine.request_interval
             request_interval.setValue(float(value))
+            value = config.get('request_rate')
+            if value is None:
+                value = self.current_engine.request_rate
+            request_rate.setValue(float(value))
             value = config.get('request_attempt')
             if value is None:
                 value = self.current_engine.request_attempt
@@ -710,6 +719,8 @@ class TranslationSetting(QDialog):
                 lambda value: config.update(concurrency_limit=value))
             request_interval.valueChanged.connect(
                 lambda value: config.update(request_interval=round(value, 1)))
+            request_rate.valueChanged.connect(
+                lambda value: config.update(request_rate=round(value, 1)))
             request_attempt.valueChanged.connect(
                 lambda value: config.update(request_attempt=value))
             request_timeout.valueChanged.connect(
@@ -1,6 +1,12 @@
+import sqlite3
 import unittest
+from unittest.mock import patch
 
-from ..lib.cache import Paragraph
+from ..lib.utils import uid
+from ..lib.cache import Paragraph, TranslationCache, get_cache_id
+
+
+module_name = 'calibre_plugins.ebook_translator.lib.cache'
 
 
 class TestParagraph(unittest.TestCase):
@@ -75,3 +81,65 @@ class TestParagraph(unittest.TestCase):
         self.paragraph.translation = 'A\n\nB\nC'
         self.paragraph.do_aligment('\n\n')
         self.assertEqual('A\n\nB\n\nC', self.paragraph.translation)
+
+
+class TestTranslationCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = TranslationCache.__new__(TranslationCache)
+        self.cache.connection = sqlite3.connect(':memory:')
+        self.cache.cursor = self.cache.connection.cursor()
+        self.cache.cursor.execute(
+            'CREATE TABLE cache('
+            'id UNIQUE, md5 UNIQUE, raw, original, ignored, '
+            'attributes DEFAULT NULL, page DEFAULT NULL,'
+            'translation DEFAULT NULL, engine_name DEFAULT NULL, '
+            'target_lang DEFAULT NULL)')
+        self.cache.fresh = True
+        for id in range(3):
+            self.cache.add(id, 'md5%s' % id, 'raw', 'original')
+
+    def tearDown(self):
+        self.cache.connection.close()
+
+    def test_update_paragraphs(self):
+        paragraphs = self.cache.get_paragraphs([0, 2])
+        for paragraph in paragraphs:
+            paragraph.translation = 'translation%s' % paragraph.id
+            paragraph.engine_name = 'Google'
+            paragraph.target_lang = 'zh'
+        self.cache.update_paragraphs(paragraphs)
+
+        translations = [
+            (paragraph.id, paragraph.translation, paragraph.engine_name)
+            for paragraph in self.cache.get_paragraphs([0, 1, 2])]
+        self.assertEqual([
+            (0, 'translation0', 'Google'), (1, None, None),
+            (2, 'translation2', 'Google')], translations)
+
+    def test_save(self):
+        self.cache.save([(3, 'md53', 'raw', 'original')])
+        self.assertEqual(4, len(self.cache.all()))
+
+    def test_save_not_fresh(self):
+        self.cache.fresh = False
+        self.cache.save([(3, 'md53', 'raw', 'original')])
+        self.assertEqual(3, len(self.cache.all()))
+
+
+class TestFunction(unittest.TestCase):
+    @patch(module_name + '.TranslationCache.exists')
+    @patch(module_name + '.file_fingerprint')
+    def test_get_cache_id(self, mock_file_fingerprint, mock_exists):
+        mock_file_fingerprint.return_value = 'abc'
+        mock_exists.return_value = False
+        self.assertEqual(
+            uid('abcGooglezh0'),
+            get_cache_id('/path/to/ebook.epub', 'Google', 'zh', '0', ''))
+        mock_file_fingerprint.assert_called_once_with('/path/to/ebook.epub')
+
+        # Prefer the cache created with the path based identity.
+        mock_exists.side_effect = lambda identity: identity == uid(
+            '/path/to/ebook.epubGooglezh0')
+        self.assertEqual(
+            uid('/path/to/ebook.epubGooglezh0'),
+            get_cache_id('/path/to/ebook.epub', 'Google', 'zh', '0', ''))
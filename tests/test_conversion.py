@@ -3,7 +3,7 @@ from pathlib import Path
 from typing import Callable
 from unittest.mock import patch, Mock
 
-from ..lib.conversion import ConversionWorker
+from ..lib.conversion import ConversionWorker, stream_item
 from ..lib.ebook import Ebook
 
 
@@ -301,3 +301,50 @@ class TestConversionWorker(unittest.TestCase):
         arguments = self.worker.gui.proceed_question.mock_calls[0].kwargs
         self.assertEqual(True, arguments.get('log_is_file'))
         self.assertIs(self.icon, arguments.get('icon'))
+
+
+class TestFunction(unittest.TestCase):
+    @patch(module_name + '.extract_book')
+    def test_stream_item(self, mock_extract_book):
+        walked = []
+
+        def get_elements():
+            for index in range(10):
+                walked.append(index)
+                yield Mock(page_id=index // 3)
+
+        mock_extract_book.side_effect = lambda path, encoding, consume: \
+            consume(get_elements())
+        elements = stream_item(
+            '/path/to/test.epub', 'epub', 'utf-8', maxsize=1)
+        self.assertEqual(0, next(elements).page_id)
+        # The first page is only handed over once its walk has finished.
+        self.assertIn(3, walked)
+        self.assertEqual(
+            [0, 0, 1, 1, 1, 2, 2, 2, 3],
+            [element.page_id for element in elements])
+        mock_extract_book.assert_called_once()
+
+    @patch(module_name + '.extract_book')
+    def test_stream_item_failed(self, mock_extract_book):
+        mock_extract_book.side_effect = Exception('failed')
+        with self.assertRaises(Exception) as cm:
+            list(stream_item('/path/to/test.epub', 'epub', 'utf-8'))
+        self.assertEqual('failed', str(cm.exception))
+
+    @patch(module_name + '.extract_book')
+    def test_stream_item_stopped_early(self, mock_extract_book):
+        mock_extract_book.side_effect = lambda path, encoding, consume: \
+            consume(Mock(page_id=index) for index in range(1000))
+        elements = stream_item(
+            '/path/to/test.epub', 'epub', 'utf-8', maxsize=1)
+        self.assertEqual(0, next(elements).page_id)
+        elements.close()
+
+    @patch(module_name + '.extra_formats')
+    def test_stream_item_extra_format(self, mock_extra_formats):
+        extractor = Mock(return_value=['a', 'b'])
+        mock_extra_formats.get.return_value = {'extractor': extractor}
+        self.assertEqual(
+            ['a', 'b'], list(stream_item('/path/to/test.srt', 'srt', 'utf-8')))
+        extractor.assert_called_once_with('/path/to/test.srt', 'utf-8')
@@ -1,5 +1,6 @@
 import re
 import unittest
+from types import GeneratorType
 from unittest.mock import patch, Mock
 
 from lxml import etree
@@ -9,7 +10,8 @@ from calibre.ebooks.oeb.base import TOC, Metadata
 from ..lib.utils import ns, create_xpath
 from ..lib.cache import Paragraph
 from ..lib.element import (
-    get_string, get_name, Extraction, ElementHandler, ElementHandlerMerge,
+    get_string, get_name, get_xpath, get_descendant_tags, get_descendants,
+    Extraction, ElementHandler, ElementHandlerMerge,
     Element, SrtElement, PgnElement, TocElement, PageElement, MetadataElement,
     get_srt_elements, get_pgn_elements, get_toc_elements,
     get_metadata_elements)
@@ -37,10 +39,42 @@ class TestFunction(unittest.TestCase):
             '<p xmlns:epub="http://www.idpf.org/2007/ops">abc</p>',
             get_string(element, True))
 
+        markup = '<div xmlns="http://www.w3.org/1999/xhtml"><svg ' \
+                 'xmlns="http://www.w3.org/2000/svg"><g/></svg></div>'
+        self.assertEqual(
+            '<div><svg><g/></svg></div>',
+            get_string(etree.XML(markup), True))
+
     def test_get_name(self):
         xhtml = '<p xmlns="http://www.w3.org/1999/xhtml">a</p>'
         self.assertEqual('p', get_name(etree.XML(xhtml)))
 
+    def test_get_xpath(self):
+        pattern = create_xpath(('b', 'i'))
+        self.assertIs(get_xpath(pattern), get_xpath(pattern))
+
+        markup = '<p xmlns="http://www.w3.org/1999/xhtml">' \
+                 '<b>a</b><span>b</span><i>c</i></p>'
+        elements = get_xpath(pattern)(etree.XML(markup))
+        self.assertEqual(['b', 'i'], [get_name(e) for e in elements])
+
+    def test_get_descendant_tags(self):
+        self.assertEqual(
+            ('{http://www.w3.org/1999/xhtml}rt',
+             '{http://www.w3.org/1999/xhtml}rp'),
+            get_descendant_tags(create_xpath(('rt', 'rp'))))
+        self.assertIsNone(get_descendant_tags(create_xpath(('rt', 'p.a'))))
+        self.assertIsNone(get_descendant_tags('self::x:rt'))
+
+    def test_get_descendants(self):
+        markup = '<p xmlns="http://www.w3.org/1999/xhtml">' \
+                 '<b>a<i>b</i></b><span class="a">c</span><i>d</i></p>'
+        element = etree.XML(markup)
+        elements = get_descendants(element, create_xpath(('i', 'b', 'p')))
+        self.assertEqual(['b', 'i', 'i'], [get_name(e) for e in elements])
+        elements = get_descendants(element, create_xpath(('i', 'span.a')))
+        self.assertEqual(['i', 'span', 'i'], [get_name(e) for e in elements])
+
     @patch('calibre_plugins.ebook_translator.lib.element.open_file')
     def test_get_srt_elements(self, mock_open_file):
         mock_open_file.return_value = '01:00\n0\na\nb\n\n02:00\n1\nc\n\n'
@@ -52,7 +86,8 @@ class TestFunction(unittest.TestCase):
 
     @patch('calibre_plugins.ebook_translator.lib.element.open_file')
     def test_get_pgn_elements(self, mock_open_file):
-        mock_open_file.return_value = '1\n2\n3\n\nabc{abc}abc\n\ndef{def}def'
+        mock_open_file.return_value = \
+            '1\n2\n3\n\nabc{abc}abc\n\n{^_^}\n\ndef{def}def'
         elements = get_pgn_elements('/path/to/pgn', 'utf-8')
         mock_open_file.assert_called_once_with('/path/to/pgn', 'utf-8')
         self.assertEqual(2, len(elements))
@@ -445,6 +480,20 @@ class TestPageElement(unittest.TestCase):
             '<code>App\\Http</code>', self.element.reserve_elements[7])
         self.assertEqual('<sup>[1]</sup>', self.element.reserve_elements[8])
 
+    def test_get_content_memoized(self):
+        content = self.element.get_content()
+        with patch.object(self.element, '_element_copy') as mock_copy:
+            self.assertEqual(content, self.element.get_content())
+            mock_copy.assert_not_called()
+        self.assertEqual(9, len(self.element.reserve_elements))
+
+        self.element.set_reserve_pattern(create_xpath(('code',)))
+        self.assertEqual(
+            r'a b c d e f g h i {{id_00000}} k[1] l',
+            self.element.get_content())
+        self.assertEqual(
+            ['<code>App\\Http</code>'], self.element.reserve_elements)
+
     def test_get_content_with_sub_sup(self):
         xhtml = etree.XML(rb"""<?xml version="1.0" encoding="utf-8"?>
 <!DOCTYPE html>
@@ -935,7 +984,8 @@ class TestExtraction(unittest.TestCase):
             [re.compile(default_rule)],
             self.extraction.filter_patterns)
         self.assertEqual(
-            ['self::x:pre', 'self::x:code'], self.extraction.ignore_patterns)
+            ['self::x:pre', 'self::x:code'],
+            [pattern.path for pattern in self.extraction.ignore_patterns])
 
     def test_get_sorted_pages(self):
         self.assertEqual(
@@ -947,7 +997,7 @@ class TestExtraction(unittest.TestCase):
         self.extraction.ignore_rules = []
 
         elements = self.extraction.get_elements()
-        self.assertIsInstance(elements, filter)
+        self.assertIsInstance(elements, GeneratorType)
         elements = list(elements)
         self.assertEqual(2, len(elements))
         self.assertIsInstance(elements[0], PageElement)
@@ -959,12 +1009,12 @@ class TestExtraction(unittest.TestCase):
 
     def test_load_priority_patterns(self):
         self.extraction.load_priority_patterns()
-        self.assertEqual(9, len(self.extraction.priority_patterns))
+        self.assertEqual(0, len(self.extraction.priority_patterns))
 
         self.extraction.priority_rules = [
             'table', 'table.list', 'invalid:class']
         self.extraction.load_priority_patterns()
-        self.assertEqual(11, len(self.extraction.priority_patterns))
+        self.assertEqual(2, len(self.extraction.priority_patterns))
 
     def test_load_filter_patterns(self):
         self.extraction.load_filter_patterns()
@@ -972,7 +1022,36 @@ class TestExtraction(unittest.TestCase):
 
         self.extraction.filter_rules = ['^a', 'b$']
         self.extraction.load_filter_patterns()
+        self.assertEqual(1, len(self.extraction.filter_patterns))
+        self.assertEqual(['^a', 'b$'], self.extraction.filter_literals)
+        self.assertIsNotNone(self.extraction.filter_pattern)
+
+        self.extraction.rule_mode = 'regex'
+        self.extraction.load_filter_patterns()
         self.assertEqual(3, len(self.extraction.filter_patterns))
+        self.assertEqual([], self.extraction.filter_literals)
+
+    def test_combine_patterns(self):
+        patterns = [re.compile('^a'), re.compile('b', re.I)]
+        pattern = self.extraction.combine_patterns(patterns)
+        self.assertEqual('(?:^a)|(?i:b)', pattern.pattern)
+        self.assertIsNotNone(pattern.search('xBx'))
+        self.assertIsNone(pattern.search('xax'))
+
+        patterns = [re.compile('^a'), re.compile(r'(b)\1')]
+        self.assertIsNone(self.extraction.combine_patterns(patterns))
+
+        patterns = [re.compile('^a'), re.compile('(?s)b.c')]
+        self.assertIsNone(self.extraction.combine_patterns(patterns))
+
+    def test_match_filter(self):
+        self.extraction.rule_mode = 'regex'
+        self.extraction.filter_rules = ['^a', r'(b)\1']
+        self.extraction.load_filter_patterns()
+        self.assertIsNone(self.extraction.filter_pattern)
+        self.assertTrue(self.extraction.match_filter('abc'))
+        self.assertTrue(self.extraction.match_filter('xbbx'))
+        self.assertFalse(self.extraction.match_filter('xbx'))
 
     def test_load_ignore_patterns(self):
         self.extraction.load_ignore_patterns()
@@ -10,8 +10,9 @@ from mechanize import HTTPError
 from mechanize._response import closeable_response as mechanize_response
 
 from ..lib.cache import Paragraph
-from ..lib.exception import UnexpectedResult, UnsupportedModel
-from ..engines.base import Base
+from ..lib.exception import (
+    UnexpectedResult, UnsupportedModel, TransientError)
+from ..engines.base import Base, TokenCache
 from ..engines.genai import GenAI
 from ..engines.deepl import DeeplTranslate
 from ..engines.openai import ChatgptTranslate, ChatgptBatchTranslate
@@ -54,6 +55,8 @@ class TestBase(unittest.TestCase):
         self.assertEqual(r'^[^\s]+$', Base.api_key_pattern)
         self.assertEqual(['401'], Base.api_key_errors)
         self.assertEqual('\n\n', Base.separator)
+        self.assertFalse(Base.support_batch)
+        self.assertEqual('\n%%\n', Base.batch_separator)
         self.assertEqual(
             ('{{{{id_{}}}}}', r'({{\s*)+id\s*_\s*{}\s*(\s*}})+'),
             Base.placeholder)
@@ -224,6 +227,18 @@ class TestBase(unittest.TestCase):
             str(cm.exception), 'HTTP Error 409: Too many requests')
         self.assertRegex(str(cm.exception), '{"error": "any error"}')
 
+    @patch(module_name + '.base.request')
+    def test_translate_with_transient_http_error(self, mock_request):
+        mock_request.side_effect = HTTPError(
+            'https://example.com/api', 429, 'Too many requests', {},
+            io.BytesIO(b'{"error": "rate limited"}'))
+
+        with self.assertRaises(TransientError) as cm:
+            self.translator.translate('Hello World')
+        self.assertEqual(
+            'HTTP Error 429: Too many requests\n\n{"error": "rate limited"}',
+            str(cm.exception))
+
     @patch(module_name + '.base.request')
     def test_translate_with_http_stream_parse_error(self, mock_request):
         self.translator.stream = True
@@ -340,6 +355,30 @@ class TestBase(unittest.TestCase):
         self.assertRegex(calls[1].args[0], 'any unexpected error')
         self.assertRegex(calls[2].args[0], 'any unexpected error')
 
+    @patch(module_name + '.base.request')
+    def test_translate_batch(self, mock_request):
+        self.translator.stream = False
+        mock_request.return_value = '你好\n%%\n世界'
+
+        self.assertEqual(
+            ['你好', '世界'], self.translator.translate_batch(['Hello', 'World']))
+
+        mock_request.assert_called_once_with(
+            url='https://example.com/api',
+            data='{"text": "Hello\\n%%\\nWorld"}',
+            headers={
+                'Authorization': 'Bearer a', 'Content-Type': 'application/json'
+            }, method='POST', timeout=10.0, proxy_uri=None, raw_object=False)
+
+    @patch(module_name + '.base.request')
+    def test_translate_batch_with_altered_separator(self, mock_request):
+        self.translator.stream = False
+        mock_request.return_value = '你好\n%% \n\n世界\n\n %%\n！'
+
+        self.assertEqual(
+            ['你好', '世界', '！'],
+            self.translator.translate_batch(['Hello', 'World', '!']))
+
     def test_allow_raw(self):
         cases = (
             (True, False, True),
@@ -356,6 +395,31 @@ class TestBase(unittest.TestCase):
                 self.assertEqual(expected, self.translator.allow_raw())
 
 
+class TestTokenCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = TokenCache()
+
+    @patch(module_name + '.base.time')
+    def test_get(self, mock_time):
+        mock_time.time.return_value = 100.0
+        fetch = Mock(return_value=('token', 200.0))
+        self.assertEqual('token', self.cache.get('engine', fetch))
+        self.assertEqual('token', self.cache.get('engine', fetch))
+        fetch.assert_called_once()
+
+        mock_time.time.return_value = 200.0
+        fetch.return_value = ('new token', 300.0)
+        self.assertEqual('new token', self.cache.get('engine', fetch))
+        self.assertEqual(2, fetch.call_count)
+
+    def test_invalidate(self):
+        fetch = Mock(side_effect=[('a', float('inf')), ('b', float('inf'))])
+        self.assertEqual('a', self.cache.get('engine', fetch))
+        self.cache.invalidate('engine')
+        self.cache.invalidate('unknown')
+        self.assertEqual('b', self.cache.get('engine', fetch))
+
+
 class TestDeepl(unittest.TestCase):
     def setUp(self):
         DeeplTranslate.set_config({'api_keys': ['a', 'b', 'c']})
@@ -393,6 +457,18 @@ class TestDeepl(unittest.TestCase):
         with self.assertRaisesRegex(Exception, error):
             self.translator.translate('Hello World!')
 
+    @patch(module_name + '.base.request')
+    def test_translate_batch(self, mock_request):
+        mock_request.return_value = '{"translations":[' \
+            '{"detected_source_language":"EN","text":"你好"},' \
+            '{"detected_source_language":"EN","text":"世界"}]}'
+
+        self.assertEqual(
+            ['你好', '世界'], self.translator.translate_batch(['Hello', 'World']))
+        self.assertEqual(
+            'text=Hello&text=World&target_lang=ZH&source_lang=EN',
+            mock_request.call_args.kwargs['data'])
+
 
 class TestChatgptTranslate(unittest.TestCase):
     def setUp(self):
@@ -0,0 +1,66 @@
+import unittest
+from unittest.mock import patch, Mock
+
+from ..lib.handler import RequestQueue, Handler
+
+
+module_name = 'calibre_plugins.ebook_translator.lib.handler'
+
+
+class TestRequestQueue(unittest.TestCase):
+    @patch(module_name + '.time')
+    def test_reserve(self, mock_time):
+        mock_time.monotonic.return_value = 100.0
+        queue = RequestQueue(2)
+        self.assertEqual(0.0, queue.reserve())
+        self.assertEqual(0.5, queue.reserve())
+        self.assertEqual(1.0, queue.reserve())
+
+        mock_time.monotonic.return_value = 102.0
+        self.assertEqual(0.0, queue.reserve())
+
+    @patch(module_name + '.time')
+    def test_acquire(self, mock_time):
+        mock_time.monotonic.return_value = 100.0
+        queue = RequestQueue(4)
+        queue.acquire()
+        mock_time.sleep.assert_not_called()
+        queue.acquire()
+        mock_time.sleep.assert_called_once_with(0.25)
+
+    @patch(module_name + '.time')
+    def test_acquire_without_limit(self, mock_time):
+        queue = RequestQueue(0)
+        queue.acquire()
+        queue.acquire()
+        mock_time.sleep.assert_not_called()
+
+
+class TestHandler(unittest.TestCase):
+    @patch(module_name + '.os.cpu_count', Mock(return_value=4))
+    def test_concurrency_limit(self):
+        handler = Handler([Mock()] * 20, 0, Mock(), Mock(), 0)
+        self.assertEqual(20, handler.concurrency_limit)
+        self.assertEqual(8, handler.thread_count)
+
+        handler = Handler([Mock()] * 3, 0, Mock(), Mock(), 0)
+        self.assertEqual(3, handler.concurrency_limit)
+        self.assertEqual(3, handler.thread_count)
+
+        handler = Handler([Mock()] * 20, 12, Mock(), Mock(), 0)
+        self.assertEqual(12, handler.concurrency_limit)
+        self.assertEqual(12, handler.thread_count)
+
+        handler = Handler([Mock()] * 2, 12, Mock(), Mock(), 0)
+        self.assertEqual(2, handler.concurrency_limit)
+        self.assertEqual(2, handler.thread_count)
+
+    def test_handle(self):
+        paragraphs = [Mock(is_cache=False) for _ in range(5)]
+        translate, process = Mock(), Mock()
+        Handler(paragraphs, 2, translate, process, 0).handle()
+
+        self.assertEqual(5, translate.call_count)
+        self.assertEqual(5, process.call_count)
+        for paragraph in paragraphs:
+            self.assertIsNone(paragraph.error)
@@ -2,8 +2,10 @@ import unittest
 from unittest.mock import patch, Mock, call
 
 from ..lib.utils import dummy
-from ..lib.translation import Glossary, ProgressBar, Translation
-from ..lib.exception import TranslationCanceled, TranslationFailed
+from ..lib.translation import (
+    Glossary, ProgressBar, BatchConfig, Batch, Translation)
+from ..lib.exception import (
+    TranslationCanceled, TranslationFailed, TransientError)
 from ..engines.base import Base
 from ..engines.deepl import DeeplTranslate
 
@@ -71,6 +73,24 @@ class TestProgressBar(unittest.TestCase):
         self.assertEqual(1.0, round(progress_bar.length, 8))
 
 
+class TestBatchConfig(unittest.TestCase):
+    def test_pack(self):
+        paragraphs = [Mock(original='a' * length) for length in (2, 2, 3, 9)]
+        batches = BatchConfig(max_chars=5, max_items=25).pack(paragraphs)
+        self.assertEqual(3, len(batches))
+        self.assertIsInstance(batches[0], Batch)
+        self.assertEqual(paragraphs[:2], batches[0].paragraphs)
+        self.assertEqual(paragraphs[2:3], batches[1].paragraphs)
+        self.assertEqual(paragraphs[3:], batches[2].paragraphs)
+
+        batches = BatchConfig(max_chars=100, max_items=3).pack(paragraphs)
+        self.assertEqual(
+            [paragraphs[:3], paragraphs[3:]],
+            [batch.paragraphs for batch in batches])
+
+        self.assertEqual([], BatchConfig().pack([]))
+
+
 class TestTranslation(unittest.TestCase):
     def setUp(self):
         self.translator = Mock()
@@ -87,6 +107,7 @@ class TestTranslation(unittest.TestCase):
 
         self.assertFalse(self.translation.fresh)
         self.assertFalse(self.translation.batch)
+        self.assertIsNone(self.translation.batch_config)
         self.assertIs(dummy, self.translation.progress)
         self.assertIs(dummy, self.translation.log)
         self.assertIs(dummy, self.translation.streaming)
@@ -107,6 +128,11 @@ class TestTranslation(unittest.TestCase):
         self.translation.set_batch(True)
         self.assertTrue(self.translation.batch)
 
+    def test_set_batch_config(self):
+        batch_config = BatchConfig()
+        self.translation.set_batch_config(batch_config)
+        self.assertIs(batch_config, self.translation.batch_config)
+
     def test_set_progress(self):
         self.assertIs(dummy, self.translation.progress)
         mock_progress = Mock()
@@ -203,6 +229,56 @@ class TestTranslation(unittest.TestCase):
             call(5), call(10), call(15), call(20), call(25)])
         self.assertEqual(6, self.translation.abort_count)
 
+    @patch('calibre_plugins.ebook_translator.lib.translation.time')
+    def test_is_repeated_error(self, mock_time):
+        mock_time.time.return_value = 100.0
+        self.assertFalse(self.translation.is_repeated_error('HTTP Error 429'))
+        self.assertTrue(self.translation.is_repeated_error('HTTP Error 429'))
+        self.assertFalse(self.translation.is_repeated_error('HTTP Error 503'))
+
+        mock_time.time.return_value = 101.5
+        self.assertFalse(self.translation.is_repeated_error('HTTP Error 429'))
+
+    @patch.object(Translation, 'need_stop', lambda self: False)
+    @patch('calibre_plugins.ebook_translator.lib.translation.traceback_error')
+    @patch('calibre_plugins.ebook_translator.lib.translation.time')
+    def test_translate_text_retry_transient_error(self, mock_time, mock_te):
+        mock_time.time.return_value = 100.0
+        self.translation.translator.match_error.return_value = False
+        self.translation.translator.translate.side_effect = TransientError(
+            'HTTP Error 429: Too many requests')
+        self.translation.log = self.log
+        self.translation.cancel_request = self.cancel_request
+        self.translator.request_attempt = 3
+
+        with self.assertRaises(TranslationFailed):
+            self.translation.translate_text(0, 'text')
+
+        mock_te.assert_not_called()
+        # The identical errors within a second are only logged once.
+        self.assertEqual(1, self.log.call_count)
+        self.assertTrue(self.log.call_args.args[0].endswith(
+            'Error: HTTP Error 429: Too many requests'))
+
+    @patch.object(Translation, 'need_stop', lambda self: False)
+    @patch('calibre_plugins.ebook_translator.lib.translation.time')
+    def test_translate_text_retry_batch(self, mock_time):
+        mock_time.time.return_value = 100.0
+        self.translator.match_error.return_value = False
+        self.translator.batch_separator = '\n%%\n'
+        self.translator.request_attempt = 3
+        self.translator.translate_batch.side_effect = [
+            TransientError('HTTP Error 429: Too many requests'), ['A', 'B']]
+        self.translation.log = self.log
+        self.translation.cancel_request = self.cancel_request
+
+        self.assertEqual(
+            ['A', 'B'], self.translation.translate_text(0, ['a', 'b']))
+        self.assertEqual(2, self.translator.translate_batch.call_count)
+        self.translator.translate_batch.assert_called_with(['a', 'b'])
+        self.translator.translate.assert_not_called()
+        self.assertIn('Original: a\n%%\nb', self.log.call_args.args[0])
+
     def test_translate_cancel_due_to_fatal_error(self):
         pass
 
@@ -253,7 +329,7 @@ class TestTranslation(unittest.TestCase):
         self.streaming.assert_has_calls([
             call(''), call('Translating...'), call(''), call('你'),
             call('好'), call('世'), call('界')])
-        mock_time.sleep.assert_called_with(0.05)
+        mock_time.sleep.assert_not_called()
 
         self.assertEqual('你好呀世界', self.paragraph.translation)
 
@@ -285,3 +361,47 @@ class TestTranslation(unittest.TestCase):
         self.translation.translate_paragraph(self.paragraph)
 
         self.paragraph.do_aligment.assert_called_once_with('\n\n')
+
+    def test_translate_batch(self):
+        paragraphs = [
+            Mock(original='a', translation=None, row=0),
+            Mock(original='b', translation='B', row=1),
+            Mock(original='c', translation=None, row=2)]
+        self.glossary.replace.side_effect = lambda text: text
+        self.glossary.restore.side_effect = lambda text: text
+        self.translator.translate_batch.return_value = ['A ', 'C']
+        self.translator.merge_enabled = False
+        self.translator.name = 'Google'
+        self.translation.translate_batch(Batch(paragraphs))
+
+        self.translator.translate_batch.assert_called_once_with(['a', 'c'])
+        self.translator.translate.assert_not_called()
+        self.assertEqual('A', paragraphs[0].translation)
+        self.assertTrue(paragraphs[1].is_cache)
+        self.assertEqual('C', paragraphs[2].translation)
+
+    def test_translate_batch_mismatched(self):
+        paragraphs = [
+            Mock(original='a', translation=None, row=0),
+            Mock(original='b', translation=None, row=1)]
+        self.glossary.replace.side_effect = lambda text: text
+        self.glossary.restore.side_effect = lambda text: text
+        self.translator.translate_batch.return_value = ['A B']
+        self.translator.translate.side_effect = ['A', 'B']
+        self.translator.merge_enabled = False
+        self.translation.translate_batch(Batch(paragraphs))
+
+        self.assertEqual(2, self.translator.translate.call_count)
+        self.assertEqual('A', paragraphs[0].translation)
+        self.assertEqual('B', paragraphs[1].translation)
+
+    def test_process_batch(self):
+        paragraphs = [Mock(is_cache=False, error=None),
+                      Mock(is_cache=True, error=None)]
+        batch = Batch(paragraphs)
+        batch.error = 'any error'
+        with patch.object(self.translation, 'process_translation') as mock:
+            self.translation.process_batch(batch)
+        mock.assert_has_calls([call(paragraphs[0]), call(paragraphs[1])])
+        self.assertEqual('any error', paragraphs[0].error)
+        self.assertIsNone(paragraphs[1].error)
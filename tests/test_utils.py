@@ -1,15 +1,21 @@
+import os
+import tempfile
 import unittest
 from unittest.mock import patch
 from types import GeneratorType
 
 from ..lib.utils import (
-    css_to_xpath, uid, trim, chunk, group, open_file, request)
+    css_to_xpath, uid, trim, chunk, group, open_file, request,
+    file_fingerprint, ssl_context)
 
 
 module_name = 'calibre_plugins.ebook_translator.lib.utils'
 
 
 class TestUtils(unittest.TestCase):
+    def setUp(self):
+        ssl_context.cache_clear()
+
     def test_css_to_xpath(self):
         self.assertEqual(["self::x:*[@id = 'id']"], css_to_xpath(['#id']))
 
@@ -18,6 +24,20 @@ class TestUtils(unittest.TestCase):
         self.assertEqual('202cb962ac59075b964b07152d234b70', uid(b'123'))
         self.assertEqual('e10adc3949ba59abbe56e057f20f883e', uid('123', '456'))
 
+    def test_file_fingerprint(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path_a = os.path.join(temp_dir, 'a.epub')
+            path_b = os.path.join(temp_dir, 'b.epub')
+            for path, content in ((path_a, b'abc'), (path_b, b'abc')):
+                with open(path, 'wb') as file:
+                    file.write(content)
+            self.assertEqual(
+                file_fingerprint(path_a), file_fingerprint(path_b))
+            with open(path_b, 'wb') as file:
+                file.write(b'abcd')
+            self.assertNotEqual(
+                file_fingerprint(path_a), file_fingerprint(path_b))
+
     def test_trim(self):
         self.assertEqual('abc', trim('   abc   '))
         self.assertEqual('a b c', trim(' a b c '))
@@ -28,6 +48,11 @@ class TestUtils(unittest.TestCase):
             '\xa0', '\x1a', u'\u3000')
         self.assertEqual('a b c', trim(content))
 
+        self.assertEqual('a b c', trim('a b c'))
+        self.assertEqual('a b c', trim('a\tb\nc'))
+        self.assertEqual('a b c', trim('a b\u200b c'))
+        self.assertEqual('ab', trim('a\x1ab'))
+
     def test_chunk(self):
         data = [1, 2, 3, 4, 5, 6, 7, 8, 9, 0]
         self.assertIsInstance(chunk(data, 3), GeneratorType)
@@ -140,3 +165,15 @@ class TestUtils(unittest.TestCase):
             'https://example.com/api', 'test data',
             headers={'User-Agent': 'Test/Agent'}, timeout=30, method='POST')
         browser.open.assert_called_once_with(mock_request())
+
+    @patch(module_name + '.ssl')
+    @patch(module_name + '.Request')
+    @patch(module_name + '.Browser')
+    def test_request_reuse_ssl_context(
+            self, mock_browser, mock_request, mock_ssl):
+        request('https://example.com/api')
+        request('https://example.com/api')
+
+        mock_ssl._create_unverified_context.assert_called_once_with(
+            cert_reqs=mock_ssl.CERT_NONE)
+        self.assertEqual(2, mock_browser().set_ca_data.call_count)